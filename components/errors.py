@@ -0,0 +1,38 @@
+# Reusable error display for Streamlit pages
+
+import streamlit as st
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def error_details_toggle(key: str = "show_error_details") -> bool:
+    """
+    Render the toggle that controls whether show_error includes tracebacks.
+
+    Call once per page (in the sidebar) and pass the result to show_error.
+
+    Returns:
+        True if tracebacks should be shown
+    """
+    return st.toggle(
+        "Show error details",
+        value=False,
+        key=key,
+        help="Show full tracebacks when a section fails to load",
+    )
+
+
+def show_error(message: str, exc: Exception, detail: bool = False) -> None:
+    """
+    Log an exception and show a compact error message.
+
+    Args:
+        message: User-facing description of what failed
+        exc: The caught exception
+        detail: If True, also render the full traceback (st.exception)
+    """
+    logger.error(f"{message}: {exc}", exc_info=exc)
+    st.error(f"{message}: {exc}")
+    if detail:
+        st.exception(exc)
@@ -18,8 +18,8 @@ class DatabaseSettings(BaseSettings):
     POSTGRES_PORT: int = Field(default=5432, ge=1, le=65535)
     DATABASE_URL: Optional[str] = Field(default=None)
     DB_SSLMODE: Optional[str] = Field(default=None)
-    DB_POOL_SIZE: int = Field(default=3, ge=1, le=50)
-    DB_MAX_OVERFLOW: int = Field(default=5, ge=0, le=100)
+    DB_POOL_SIZE: int = Field(default=5, ge=1, le=50)
+    DB_MAX_OVERFLOW: int = Field(default=10, ge=0, le=100)
     DB_POOL_RECYCLE: int = Field(default=1800, ge=300)
     SQLALCHEMY_ECHO: bool = Field(default=False)
 
@@ -0,0 +1,111 @@
+"""
+Metric configuration for the Teams page stat tabs.
+
+Kept outside the page module so services (e.g. cache warming) can request
+exactly the league columns the page reads.
+"""
+
+# Radar metrics: (metric_key, display_label)
+# Table metrics: (metric_key, display_name, decimals)
+
+ATTACK_RADAR_METRICS = [
+    ('goals_per_game', 'Goals/Game'),
+    ('xg_per_game', 'xG/Game'),
+    ('shots_per_game', 'Shots/Game'),
+    ('shots_on_target_per_game', 'Shots on Target/Game'),
+    ('big_chances_created_per_game', 'Big Chances/Game'),
+    ('touches_in_box_per_game', 'Touches In Box/Game'),
+]
+
+ATTACK_METRICS = [
+    ('goals_per_game', 'Goals per Game', 2),
+    ('total_goals', 'Total Goals', 0),
+    ('xg_per_game', 'xG per Game', 2),
+    ('total_xg', 'Total xG', 2),
+    ('xg_difference', 'xG Difference', 2),
+    ('shots_per_game', 'Shots per Game', 2),
+    ('shots_on_target_per_game', 'Shots on Target/Game', 2),
+    ('big_chances_created_per_game', 'Big Chances/Game', 2),
+    ('big_chances_scored_per_game', 'Big Chances Scored/Game', 2),
+    ('corners_per_game', 'Corners per Game', 2),
+    ('touches_in_box_per_game', 'Touches in Box/Game', 2)
+]
+
+DEFENSE_RADAR_METRICS = [
+    ('tackles_per_game', 'Tackles/Game'),
+    ('interceptions_per_game', 'Interceptions/Game'),
+    ('clearances_per_game', 'Clearances/Game'),
+    ('blocked_shots_per_game', 'Blocked Shots/Game'),
+    ('ball_recoveries_per_game', 'Ball Recoveries/Game'),
+    ('clean_sheet_pct', 'Clean Sheet %'),
+]
+
+DEFENSE_METRICS = [
+    ('goals_conceded_per_game', 'Goals Conceded/Game', 2),
+    ('total_goals_conceded', 'Total Goals Conceded', 0),
+    ('xga_per_game', 'xGA/Game', 2),
+    ('total_xga', 'Total xGA', 2),
+    ('xga_difference', 'xGA Difference', 2),
+    ('xga_difference_per_game', 'xGA Difference/Game', 2),
+    ('clean_sheets', 'Clean Sheets', 0),
+    ('clean_sheet_pct', 'Clean Sheet %', 1),
+    ('tackles_per_game', 'Tackles/Game', 2),
+    ('avg_tackles_won_pct', 'Tackles Won %', 1),
+    ('interceptions_per_game', 'Interceptions/Game', 2),
+    ('clearances_per_game', 'Clearances/Game', 2),
+    ('blocked_shots_per_game', 'Blocked Shots/Game', 2),
+    ('ball_recoveries_per_game', 'Ball Recoveries/Game', 2),
+    ('avg_aerial_duels_pct', 'Aerial Duels Won %', 1),
+    ('avg_ground_duels_pct', 'Ground Duels Won %', 1),
+    ('saves_per_game', 'Saves/Game', 2)
+]
+
+# Metrics where lower is better
+DEFENSE_INVERTED = ['goals_conceded_per_game', 'total_goals_conceded', 'xga_per_game', 'total_xga']
+
+POSSESSION_RADAR_METRICS = [
+    ('avg_possession_pct', 'Possession %'),
+    ('pass_accuracy_pct', 'Pass Accuracy %'),
+    ('accurate_passes_per_game', 'Accurate Passes/Game'),
+    ('accurate_long_balls_per_game', 'Long Balls/Game'),
+    ('final_third_entries_per_game', 'Final Third Entries/Game'),
+    ('touches_in_box_per_game', 'Touches In Box/Game'),
+]
+
+POSSESSION_METRICS = [
+    ('avg_possession_pct', 'Avg Possession %', 1),
+    ('pass_accuracy_pct', 'Pass Accuracy %', 1),
+    ('total_passes_per_game', 'Total Passes/Game', 1),
+    ('accurate_passes_per_game', 'Accurate Passes/Game', 1),
+    ('accurate_long_balls_per_game', 'Long Balls/Game', 2),
+    ('accurate_crosses_per_game', 'Accurate Crosses/Game', 2),
+    ('final_third_entries_per_game', 'Final Third Entries/Game', 2),
+    ('touches_in_box_per_game', 'Touches in Box/Game', 2),
+    ('dispossessed_per_game', 'Dispossessed/Game', 2),
+    ('total_accurate_passes', 'Total Accurate Passes', 0),
+    ('total_passes', 'Total Passes', 0)
+]
+
+POSSESSION_INVERTED = ['dispossessed_per_game']
+
+DISCIPLINE_METRICS = [
+    ('yellow_cards_per_game', 'Yellow Cards/Game', 2),
+    ('total_yellow_cards', 'Total Yellow Cards', 0),
+    ('total_red_cards', 'Red Cards', 0),
+    ('fouls_per_game', 'Fouls/Game', 2),
+    ('total_fouls', 'Total Fouls', 0),
+    ('offsides_per_game', 'Offsides/Game', 2),
+    ('total_offsides', 'Total Offsides', 0),
+    ('free_kicks_per_game', 'Free Kicks/Game', 2),
+    ('total_free_kicks', 'Total Free Kicks', 0)
+]
+
+# All discipline metrics - lower is better
+DISCIPLINE_INVERTED = [metric[0] for metric in DISCIPLINE_METRICS]
+
+# League-wide columns each tab actually reads (radar scales + percentiles)
+LEAGUE_STAT_COLUMNS = {
+    'attack': tuple(dict.fromkeys(m[0] for m in ATTACK_RADAR_METRICS + ATTACK_METRICS)),
+    'defense': tuple(dict.fromkeys(m[0] for m in DEFENSE_RADAR_METRICS + DEFENSE_METRICS)),
+    'possession': tuple(dict.fromkeys(m[0] for m in POSSESSION_RADAR_METRICS + POSSESSION_METRICS)),
+}
@@ -63,47 +63,53 @@ def prepare_bulk_team_forms(team_ids: list, last_n: int = 5):
     # Format output
     form_cache = {}
     for team_id in team_ids:
-        team_id_int = int(team_id)
-        form_data = forms_dict.get(team_id_int)
+        form_data = forms_dict.get(team_id)
         
         if not form_data:
-            form_cache[team_id_int] = "N/A"
+            form_cache[team_id] = "N/A"
             continue
         
         last_5 = form_data.get('last_5_results')
         if last_5 and isinstance(last_5, str) and len(last_5.strip()) > 0:
-            form_cache[team_id_int] = last_5.strip()[:5]
+            form_cache[team_id] = last_5.strip()[:5]
         else:
-            form_cache[team_id_int] = "N/A"
+            form_cache[team_id] = "N/A"
     
     return form_cache
 
-def prepare_bulk_h2h_records(fixture_pairs: list):
+def prepare_bulk_h2h_records(fixtures_df: pd.DataFrame) -> pd.Series:
     """
     Use BATCH query from services/queries.py
+    Returns H2H strings (home W-D-L) aligned with fixtures_df index.
     """
     from services.queries import get_bulk_head_to_head
     
+    fixture_pairs = list(zip(fixtures_df['home_team_id'], fixtures_df['away_team_id']))
+    
     # Single query for all pairs
     h2h_dict = get_bulk_head_to_head(fixture_pairs)
     
-    # Format output
-    h2h_cache = {}
+    if not h2h_dict:
+        return pd.Series("No H2H", index=fixtures_df.index)
+    
+    # A handful of pairs: a dict lookup per fixture beats building and merging
+    # a throwaway DataFrame
+    records = []
     for home_id, away_id in fixture_pairs:
         h2h_data = h2h_dict.get((home_id, away_id))
-        
-        if not h2h_data or h2h_data.get('total_matches', 0) == 0:
-            h2h_cache[(home_id, away_id)] = "No H2H"
+        if not h2h_data or not h2h_data.get('total_matches'):
+            records.append("No H2H")
             continue
         
-        if h2h_data['team1_id'] == home_id:
-            h2h_string = f"{h2h_data['team1_wins']}-{h2h_data['draws']}-{h2h_data['team2_wins']}"
-        else:
-            h2h_string = f"{h2h_data['team2_wins']}-{h2h_data['draws']}-{h2h_data['team1_wins']}"
-        
-        h2h_cache[(home_id, away_id)] = h2h_string
+        # Orient wins from the home team's perspective
+        team1_wins = int(h2h_data.get('team1_wins') or 0)
+        team2_wins = int(h2h_data.get('team2_wins') or 0)
+        home_wins, away_wins = (
+            (team1_wins, team2_wins) if h2h_data.get('team1_id') == home_id else (team2_wins, team1_wins)
+        )
+        records.append(f"{home_wins}-{int(h2h_data.get('draws') or 0)}-{away_wins}")
     
-    return h2h_cache
+    return pd.Series(records, index=fixtures_df.index)
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -125,71 +131,85 @@ def format_prediction(row):
     else:
         return f"Draw ({draw_prob:.1f}%)"
 
+# Form boxes are rendered for every fixture, so build each span once at import
+FORM_SPAN_TEMPLATE = (
+    '<span style="display:inline-block; width:20px; height:20px; '
+    'background-color:{color}; color:white; text-align:center; '
+    'line-height:20px; margin:1px; border-radius:3px; '
+    'font-weight:bold; font-size:12px;">{char}</span>'
+)
+UNKNOWN_FORM_COLOR = '#6b7280'
+FORM_HTML = {
+    char: FORM_SPAN_TEMPLATE.format(color=color, char=char)
+    for char, color in [('W', '#22c55e'), ('D', '#eab308'), ('L', '#ef4444')]
+}
+
 def format_form_html(form_string):
     """Convert form string to HTML with colored boxes."""
     if form_string == "N/A" or not form_string:
         return "N/A"
     
-    colors = {'W': '#22c55e', 'D': '#eab308', 'L': '#ef4444'}
-    
-    html_parts = []
-    for char in form_string:
-        color = colors.get(char, '#6b7280')
-        html_parts.append(
-            f'<span style="display:inline-block; width:20px; height:20px; '
-            f'background-color:{color}; color:white; text-align:center; '
-            f'line-height:20px; margin:1px; border-radius:3px; '
-            f'font-weight:bold; font-size:12px;">{char}</span>'
-        )
-    
-    return ''.join(html_parts)
+    return ''.join(
+        FORM_HTML.get(char) or FORM_SPAN_TEMPLATE.format(color=UNKNOWN_FORM_COLOR, char=char)
+        for char in form_string
+    )
 
 def render_fixtures_table(fixtures_df):
     """
     Render fixtures overview table WITHOUT detailed expanders.
     FAST: Only table rendering, no heavy computations.
     """
-    display_df = fixtures_df[[
-        'match_date', 'home_team', 'home_form_html',
-        'away_team', 'away_form_html', 'h2h',
-        'prediction', 'round_number', 'tournament'
-    ]].copy()
-    
-    display_df.columns = [
+    headers = [
         'Date', 'Home Team', 'Form (H)',
         'Away Team', 'Form (A)', 'H2H (W-D-L)',
         'Prediction', 'Round', 'Tournament'
     ]
     
-    # HTML table with custom styling
-    html_table = '<table style="width:100%; border-collapse: collapse;">'
-    html_table += '<thead><tr style="background-color: #f0f2f6;">'
-    for col in display_df.columns:
-        html_table += f'<th style="padding: 10px; text-align: left; border-bottom: 2px solid #ddd;">{col}</th>'
-    html_table += '</tr></thead><tbody>'
-    
-    for idx, row in display_df.iterrows():
-        html_table += '<tr style="border-bottom: 1px solid #eee;">'
-        html_table += f'<td style="padding: 10px;">{row["Date"].strftime("%Y-%m-%d %H:%M")}</td>'
-        html_table += f'<td style="padding: 10px;">{row["Home Team"]}</td>'
-        html_table += f'<td style="padding: 10px;">{fixtures_df.loc[idx, "home_form_html"]}</td>'
-        html_table += f'<td style="padding: 10px;">{row["Away Team"]}</td>'
-        html_table += f'<td style="padding: 10px;">{fixtures_df.loc[idx, "away_form_html"]}</td>'
-        html_table += f'<td style="padding: 10px; text-align: center;">{row["H2H (W-D-L)"]}</td>'
-        html_table += f'<td style="padding: 10px;">{row["Prediction"]}</td>'
-        html_table += f'<td style="padding: 10px; text-align: center;">{row["Round"]}</td>'
-        html_table += f'<td style="padding: 10px;">{row["Tournament"]}</td>'
-        html_table += '</tr>'
+    # Read the columns in place (no copied/renamed display frame) and format
+    # the dates in one vectorized call
+    dates = pd.to_datetime(fixtures_df['match_date']).dt.strftime("%Y-%m-%d %H:%M")
+    rows = ''.join(
+        '<tr style="border-bottom: 1px solid #eee;">'
+        f'<td style="padding: 10px;">{date}</td>'
+        f'<td style="padding: 10px;">{home}</td>'
+        f'<td style="padding: 10px;">{home_form}</td>'
+        f'<td style="padding: 10px;">{away}</td>'
+        f'<td style="padding: 10px;">{away_form}</td>'
+        f'<td style="padding: 10px; text-align: center;">{h2h}</td>'
+        f'<td style="padding: 10px;">{prediction}</td>'
+        f'<td style="padding: 10px; text-align: center;">{round_number}</td>'
+        f'<td style="padding: 10px;">{tournament}</td>'
+        '</tr>'
+        for date, home, home_form, away, away_form, h2h, prediction, round_number, tournament in zip(
+            dates, fixtures_df['home_team'], fixtures_df['home_form_html'],
+            fixtures_df['away_team'], fixtures_df['away_form_html'], fixtures_df['h2h'],
+            fixtures_df['prediction'], fixtures_df['round_number'], fixtures_df['tournament']
+        )
+    )
+    header_cells = ''.join(
+        f'<th style="padding: 10px; text-align: left; border-bottom: 2px solid #ddd;">{col}</th>'
+        for col in headers
+    )
     
-    html_table += '</tbody></table>'
+    # HTML table with custom styling
+    html_table = (
+        '<table style="width:100%; border-collapse: collapse;">'
+        f'<thead><tr style="background-color: #f0f2f6;">{header_cells}</tr></thead>'
+        f'<tbody>{rows}</tbody></table>'
+    )
     st.markdown(html_table, unsafe_allow_html=True)
 
 def render_match_details(match, idx):
     """
-    Render detailed match expander.
-    LAZY: Only called for visible/expanded matches.
+    Render detailed match panel.
+    LAZY: Only the toggle header is rendered until the user opens the match,
+    so collapsed fixtures don't mount their metric widgets.
     """
-    with st.expander(f"{match['home_team']} vs {match['away_team']} - {match['match_date'].strftime('%Y-%m-%d %H:%M')}"):
+    title = f"{match['home_team']} vs {match['away_team']} - {match['match_date'].strftime('%Y-%m-%d %H:%M')}"
+    if not st.toggle(title, key=f"fixture_details_{match['match_id']}"):
+        return
+    
+    with st.container(border=True):
         col1, col2, col3 = st.columns(3)
         
         # Column 1: Match Prediction
@@ -282,8 +302,10 @@ def fixtures():
     # Sidebar filters
     with st.sidebar:
         from components.filters import date_range_filter
+        from components.errors import error_details_toggle, show_error
         
         st.header("Filters")
+        show_error_details = error_details_toggle()
         
         today = date.today()
         default_end = today + timedelta(days=45)
@@ -330,36 +352,29 @@ def fixtures():
         
         st.success(f"Found {len(fixtures_df)} fixtures")
         
-        # STEP 2: Prepare unique team IDs for BATCH fetching
-        unique_team_ids = list(set(
-            list(fixtures_df['home_team_id'].astype(int)) + 
-            list(fixtures_df['away_team_id'].astype(int))
-        ))
+        # STEP 2: Cast team IDs once, then prepare unique IDs for BATCH fetching
+        fixtures_df['home_team_id'] = fixtures_df['home_team_id'].astype('int64')
+        fixtures_df['away_team_id'] = fixtures_df['away_team_id'].astype('int64')
+        unique_team_ids = pd.unique(
+            pd.concat([fixtures_df['home_team_id'], fixtures_df['away_team_id']])
+        ).tolist()
         
         # STEP 3: BATCH FETCH team forms (CACHED - single call for all teams!)
         form_cache = prepare_bulk_team_forms(unique_team_ids, last_n=5)
         
         # STEP 4: BATCH FETCH H2H records (CACHED)
-        fixture_pairs = list(zip(
-            fixtures_df['home_team_id'].astype(int),
-            fixtures_df['away_team_id'].astype(int)
-        ))
-        h2h_cache = prepare_bulk_h2h_records(fixture_pairs)
+        h2h_series = prepare_bulk_h2h_records(fixtures_df)
         
         # STEP 5: Enrich fixtures_df with cached data (FAST - no DB calls!)
-        fixtures_df['home_form'] = fixtures_df['home_team_id'].apply(lambda x: form_cache.get(int(x), "N/A"))
-        fixtures_df['away_form'] = fixtures_df['away_team_id'].apply(lambda x: form_cache.get(int(x), "N/A"))
+        fixtures_df['home_form'] = fixtures_df['home_team_id'].map(form_cache).fillna("N/A")
+        fixtures_df['away_form'] = fixtures_df['away_team_id'].map(form_cache).fillna("N/A")
         fixtures_df['home_form_html'] = fixtures_df['home_form'].apply(format_form_html)
         fixtures_df['away_form_html'] = fixtures_df['away_form'].apply(format_form_html)
-        fixtures_df['h2h'] = fixtures_df.apply(
-            lambda row: h2h_cache.get((int(row['home_team_id']), int(row['away_team_id'])), "No H2H"),
-            axis=1
-        )
+        fixtures_df['h2h'] = h2h_series
         fixtures_df['prediction'] = fixtures_df.apply(format_prediction, axis=1)
         
     except Exception as e:
-        st.error(f"Error loading fixtures: {e}")
-        st.exception(e)
+        show_error("Error loading fixtures", e, detail=show_error_details)
         st.stop()
     
     # ========================================================================
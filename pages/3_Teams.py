@@ -5,14 +5,15 @@ Team statistics and performance analysis page
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from typing import Optional, Dict, Any, Tuple
 import logging
-import matplotlib.pyplot as plt
-from mplsoccer import Radar
 import warnings
+from dataclasses import dataclass
+from collections import Counter
+from bisect import bisect
 import time
+import io
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -92,12 +93,140 @@ st.markdown("""
         font-weight: 700;
         color: #111827;
     }
+    /* Stats Tables */
+    .stats-table {
+        width: 100%;
+        border-collapse: collapse;
+    }
+    .stats-table th {
+        background-color: #f0f2f6;
+        padding: 8px;
+        text-align: left;
+        font-weight: 600;
+        border-bottom: 2px solid #e0e0e0;
+    }
+    .stats-table td {
+        padding: 8px;
+        border-bottom: 1px solid #e0e0e0;
+    }
     </style>
     """, unsafe_allow_html=True)
 
+# ============================================================================
+# METRIC CONFIGURATION
+# ============================================================================
+
+from config.team_metrics import (
+    ATTACK_RADAR_METRICS, ATTACK_METRICS,
+    DEFENSE_RADAR_METRICS, DEFENSE_METRICS, DEFENSE_INVERTED,
+    POSSESSION_RADAR_METRICS, POSSESSION_METRICS, POSSESSION_INVERTED,
+    DISCIPLINE_METRICS, DISCIPLINE_INVERTED,
+    LEAGUE_STAT_COLUMNS,
+)
+
+@dataclass(frozen=True)
+class StatTabSpec:
+    """Configuration for a stat tab (see render_stat_tab / render_stats_section)."""
+    stat_type: str              # key for league stats and league averages
+    title: str
+    table_metrics: list
+    inverted_metrics: list
+    radar_metrics: list = ()    # empty: table-only tab (no radar)
+    radar_color: str = ''
+    radar_edge_color: str = ''
+
+ATTACK_TAB = StatTabSpec(
+    stat_type='attack',
+    title='Attack',
+    radar_metrics=ATTACK_RADAR_METRICS,
+    table_metrics=ATTACK_METRICS,
+    inverted_metrics=[],
+    radar_color='#fbbf24',       # Gold
+    radar_edge_color='#f59e0b',  # Orange
+)
+
+DEFENSE_TAB = StatTabSpec(
+    stat_type='defense',
+    title='Defense',
+    radar_metrics=DEFENSE_RADAR_METRICS,
+    table_metrics=DEFENSE_METRICS,
+    inverted_metrics=DEFENSE_INVERTED,
+    radar_color='#ef4444',       # Red
+    radar_edge_color='#dc2626',  # Dark red
+)
+
+POSSESSION_TAB = StatTabSpec(
+    stat_type='possession',
+    title='Possession',
+    radar_metrics=POSSESSION_RADAR_METRICS,
+    table_metrics=POSSESSION_METRICS,
+    inverted_metrics=POSSESSION_INVERTED,
+    radar_color='#8b5cf6',       # Purple
+    radar_edge_color='#7c3aed',  # Dark purple
+)
+
+DISCIPLINE_TAB = StatTabSpec(
+    stat_type='discipline',
+    title='Discipline',
+    table_metrics=DISCIPLINE_METRICS,
+    inverted_metrics=DISCIPLINE_INVERTED,
+)
+
+# Fair play score bands: FAIR_PLAY_RATINGS[bisect(FAIR_PLAY_THRESHOLDS, score)]
+FAIR_PLAY_THRESHOLDS = (2, 3, 4)
+FAIR_PLAY_RATINGS = (
+    ("Excellent ⭐⭐⭐", "green"),
+    ("Good ⭐⭐", "blue"),
+    ("Average ⭐", "orange"),
+    ("Poor ⚠️", "red"),
+)
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_ranked_standings(season_id: int) -> pd.DataFrame:
+    """
+    Season standings with a 'position' column, indexed by team_id (column kept).
+    
+    Ranking (points, goal difference, goals for) and indexing happen once per
+    season instead of on every rerun; each caller gets its own copy.
+    """
+    from services.queries import get_league_standings
+    from services.transforms import calculate_standings_position
+    
+    standings = get_league_standings(season_id)
+    if standings.empty:
+        return standings
+    standings['position'] = calculate_standings_position(standings)
+    return standings.set_index('team_id', drop=False)
+
+def load_season_bundle(season_id: int) -> Dict[str, Any]:
+    """
+    Load the season-wide data every tab reads from, side by side.
+    
+    Ranked standings, league averages and the league stat frames (attack, defense,
+    possession in one joined query) are each cached per season, so a warm
+    rerun is network-free; on a cold cache the three reads overlap.
+    
+    Returns:
+        Dict with 'standings' (DataFrame from load_ranked_standings), 'league_averages' (dict) and
+        'league_stats' (stat_type -> shared DataFrame, do not mutate)
+    """
+    from services.cache import load_concurrently
+    from services.queries import get_league_averages, load_league_stats
+    
+    standings, league_averages, league_stats = load_concurrently(
+        (load_ranked_standings, (season_id,)),
+        (get_league_averages, (season_id,)),
+        (load_league_stats, (season_id, LEAGUE_STAT_COLUMNS)),
+    )
+    return {
+        'standings': standings,
+        'league_averages': league_averages,
+        'league_stats': league_stats,
+    }
+
 def lazy_get_team_form(team_id: int, last_n_matches: int = 5) -> Optional[Dict[str, Any]]:
     """Lazy load team form to avoid circular imports."""
     try:
@@ -127,7 +256,8 @@ def lazy_get_team_stats(stat_type: str, season_id: int, team_id: Optional[int] =
 def lazy_calculate_league_stats_and_percentiles(
     all_teams_df: pd.DataFrame,
     team_stats: Dict[str, Any],
-    league_avg: Optional[Dict[str, Any]] = None
+    league_avg: Optional[Dict[str, Any]] = None,
+    league_percentiles: Optional[pd.DataFrame] = None
 ) -> Tuple[Dict[str, float], Dict[str, float]]:
     """
     Lazy calculate percentiles to avoid circular imports.
@@ -136,13 +266,16 @@ def lazy_calculate_league_stats_and_percentiles(
         all_teams_df: DataFrame with all teams' statistics
         team_stats: Dictionary of selected team's statistics
         league_avg: Optional pre-calculated league averages
+        league_percentiles: Optional rank matrix from load_league_percentiles
     
     Returns:
         Tuple of (league_averages_dict, percentiles_dict)
     """
     try:
         from services.transforms import calculate_league_stats_and_percentiles
-        return calculate_league_stats_and_percentiles(all_teams_df, team_stats, league_avg)
+        return calculate_league_stats_and_percentiles(
+            all_teams_df, team_stats, league_avg, league_percentiles
+        )
     except Exception as e:
         logger.error(f"Error calculating league stats and percentiles: {e}")
         return {}, {}
@@ -158,6 +291,38 @@ def safe_get(data: Optional[Dict[str, Any]], key: str, default: Any = 0) -> Any:
     return value
 
 
+def metric_values(data: Optional[Dict[str, Any]], keys: list, default: float = 0.0) -> np.ndarray:
+    """Gather values for keys into a float array, replacing None/missing with default."""
+    values = np.array([(data or {}).get(key) for key in keys], dtype=float)
+    return np.where(np.isnan(values), default, values)
+
+@dataclass(frozen=True)
+class MetricArrays:
+    """
+    Team, league average and percentile values for one key order (NaN = missing).
+    
+    Built once per stat tab from the three dicts; the radar and the stats
+    table slice it with take() instead of each reading the dicts again.
+    """
+    keys: tuple
+    team: np.ndarray
+    league: np.ndarray
+    pct: np.ndarray
+    
+    @classmethod
+    def from_stats(cls, keys, team_stats, league_avg, percentiles) -> "MetricArrays":
+        keys = tuple(dict.fromkeys(keys))  # radar and table share metrics: de-duplicate, keep order
+        def gather(data):
+            return np.array([(data or {}).get(key) for key in keys], dtype=float)
+        return cls(keys, gather(team_stats), gather(league_avg), gather(percentiles))
+    
+    def take(self, keys) -> "MetricArrays":
+        """Sub-arrays for keys (each must be in self.keys), in the given order."""
+        position = {key: i for i, key in enumerate(self.keys)}
+        index = [position[key] for key in keys]
+        return MetricArrays(tuple(keys), self.team[index], self.league[index], self.pct[index])
+
+
 def format_percentage(value: Optional[float]) -> str:
     """Format float as percentage string."""
     if value is None:
@@ -174,20 +339,120 @@ def parse_form_results(form_string: Optional[str], max_length: int = 5) -> list:
     """Parse form string (e.g., 'WWDLW') into list of results."""
     if not form_string:
         return []
-    results = list(form_string[:max_length])
-    return results
+    return list(form_string[:max_length])
+
+# Form squares: 40px boxes with a 2px margin, drawn as one SVG image
+FORM_SQUARE_SIZE = 40
+FORM_SQUARE_STEP = FORM_SQUARE_SIZE + 4
+UNKNOWN_FORM_COLOR = "#6b7280"
+FORM_COLORS = {"W": "#22c55e", "D": "#eab308", "L": "#ef4444"}
+FORM_RECT_TEMPLATE = (
+    '<rect x="{x}" y="2" width="40" height="40" rx="5" fill="{color}"/>'
+    '<text x="{text_x}" y="27" text-anchor="middle" fill="white" '
+    'font-family="sans-serif" font-size="16" font-weight="bold">{char}</text>'
+)
+
+@st.cache_data(show_spinner=False)
+def form_svg(results: tuple) -> str:
+    """
+    Form squares as an SVG data URI for st.image (cached per result sequence).
+
+    One image instead of a span per result keeps the DOM small and skips
+    the markdown/HTML sanitization pass on every rerun.
+    """
+    from base64 import b64encode
+    from html import escape
+
+    squares = "".join(
+        FORM_RECT_TEMPLATE.format(
+            x=i * FORM_SQUARE_STEP + 2,
+            text_x=i * FORM_SQUARE_STEP + 2 + FORM_SQUARE_SIZE // 2,
+            color=FORM_COLORS.get(result, UNKNOWN_FORM_COLOR),
+            char=escape(result),
+        )
+        for i, result in enumerate(results)
+    )
+    width = len(results) * FORM_SQUARE_STEP
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{FORM_SQUARE_STEP}" viewBox="0 0 {width} {FORM_SQUARE_STEP}">{squares}</svg>'
+    )
+    return "data:image/svg+xml;base64," + b64encode(svg.encode("utf-8")).decode("ascii")
 
-def results_to_points(results: list) -> list:
-    """Convert W/D/L results to points [3, 1, 0]."""
-    points_map = {'W': 3, 'D': 1, 'L': 0}
-    return [points_map.get(r, 0) for r in results]
+# Byte -> points lookup table (W=3, D=1, anything else 0)
+_POINTS_LUT = np.zeros(256, dtype=np.int8)
+_POINTS_LUT[ord('W')] = 3
+_POINTS_LUT[ord('D')] = 1
 
-def prepare_dataframe_for_display(df: pd.DataFrame) -> pd.DataFrame:
+def results_to_points(results: list) -> np.ndarray:
     """
-    Prepare DataFrame for Streamlit display by converting all columns to strings.
-    This prevents Arrow serialization issues with mixed types.
+    Convert W/D/L results to points [3, 1, 0].
+    
+    Returns an int8 array: Plotly sends typed arrays to the browser as compact
+    base64 buffers instead of JSON number lists.
+    """
+    if not results:
+        return np.zeros(0, dtype=np.int8)
+    codes = np.frombuffer(''.join(results).encode('ascii', 'replace'), dtype=np.uint8)
+    return _POINTS_LUT[codes]
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def form_chart_figure(results: tuple, uirevision: str):
     """
-    return df.astype(str)
+    Points-per-match line and W/D/L pie for a result sequence, as one figure.
+    
+    The figure depends only on the results, so unrelated reruns (other widgets,
+    tab switches) reuse the same object (cache_resource: no pickling of figures).
+    Plotly is imported here so other tabs never pay for it.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    points = results_to_points(results)
+    match_numbers = np.arange(1, len(points) + 1, dtype=np.int16)
+    counts = Counter(results)
+    
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        column_widths=[2 / 3, 1 / 3],
+        specs=[[{"type": "xy"}, {"type": "domain"}]],
+        subplot_titles=("Points per match", "Result distribution"),
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=match_numbers,
+            y=points,
+            mode="lines+markers",
+            name="Points",
+            text=list(results),
+            hovertemplate="Match %{x}<br>Points: %{y} (%{text})<extra></extra>",
+            marker=dict(size=8),
+            line=dict(width=2),
+            showlegend=False,
+        ),
+        row=1,
+        col=1,
+    )
+    fig.add_trace(
+        go.Pie(
+            labels=["Wins", "Draws", "Losses"],
+            values=np.array([counts["W"], counts["D"], counts["L"]], dtype=np.int16),
+            marker=dict(colors=["#22c55e", "#eab308", "#ef4444"]),
+            textinfo="value+percent",
+            sort=False,
+        ),
+        row=1,
+        col=2,
+    )
+    fig.update_xaxes(title_text="Match", row=1, col=1)
+    fig.update_yaxes(title_text="Points", range=[-0.5, 3.5], tickvals=[0, 1, 3], row=1, col=1)
+    fig.update_layout(
+        height=350,
+        hovermode="x unified",
+        uirevision=uirevision,
+    )
+    return fig
 
 def render_stat_box(label: str, value: Any, help_text: Optional[str] = None):
     """Render a rectangle-styled stat box using HTML."""
@@ -199,11 +464,93 @@ def render_stat_box(label: str, value: Any, help_text: Optional[str] = None):
         </div>
     """, unsafe_allow_html=True)
 
+# Overview stat boxes: one tuple per column, each box is (label, stats key, formatter).
+# A None formatter shows the raw value.
+OVERVIEW_ATTACK_BOXES = (
+    (("Goals for", "total_goals", int), ("Total xG", "total_xg", None), ("xG Diff", "xg_difference", None)),
+)
+OVERVIEW_DEFENSE_BOXES = (
+    (
+        ("Goals against", "total_goals_conceded", int),
+        ("Total xGA", "total_xga", format_number),
+        ("xGA Diff", "xga_difference", format_number),
+    ),
+    (("Clean Sheets", "clean_sheets", int), ("Clean Sheets %", "clean_sheet_pct", format_percentage)),
+)
+OVERVIEW_BTTS_BOXES = (
+    (("AVG Goals per Match", "overall_avg_goals_per_match", None), ("BTTS %", "overall_btts_pct", format_percentage)),
+    (("AVG Goals For", "overall_avg_scored", None), ("AVG xG per Match", "overall_avg_xg", None)),
+    (("AVG Goals Against", "overall_avg_conceded", None), ("AVG xGA per Match", "overall_avg_xga", None)),
+)
+
+def render_stat_columns(columns: list, stats: Dict[str, Any], boxes: tuple) -> None:
+    """Render stat boxes column by column from a box spec (one metric_values pass)."""
+    keys = [key for column_boxes in boxes for _, key, _ in column_boxes]
+    values = iter(metric_values(stats, keys).tolist())
+    for column, column_boxes in zip(columns, boxes):
+        with column:
+            for label, _, formatter in column_boxes:
+                value = next(values)
+                render_stat_box(label, formatter(value) if formatter else value)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_league_percentiles(
+    season_id: int,
+    stat_type: str,
+    _all_teams_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    League percentile matrix (team_id x metric), ranked once per season.
+    
+    Switching teams or tabs then only slices a row. Like load_radar_scales,
+    the frame is keyed by (season_id, stat_type) instead of being hashed.
+    """
+    from services.transforms import calculate_league_percentiles
+    
+    return calculate_league_percentiles(_all_teams_df)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_league_means(
+    season_id: int,
+    stat_type: str,
+    _all_teams_df: pd.DataFrame
+) -> Dict[str, float]:
+    """
+    League column means per metric, computed once per season (same keying as
+    load_league_percentiles), so a team switch never re-averages the frame.
+    """
+    from services.transforms import calculate_league_means
+    
+    return calculate_league_means(_all_teams_df)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_radar_scales(
+    season_id: int,
+    stat_type: str,
+    metrics: tuple,
+    _all_teams_df: pd.DataFrame
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Radar ranges (0 to league 95th percentile) per metric, cached per season.
+    
+    The league frame is fully determined by (season_id, stat_type), so it is
+    excluded from the cache key (leading underscore) instead of being hashed.
+    """
+    from services.transforms import metric_matrix
+    
+    matrix = metric_matrix(_all_teams_df, list(metrics))
+    
+    # One quantile pass over all metrics; empty columns count as 0
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+        highs = np.nan_to_num(np.nanquantile(matrix, 0.95, axis=0), nan=0.0)
+    highs = np.maximum(highs, 0.01)  # Prevent division by zero
+    
+    return {metric: (0.0, float(high)) for metric, high in zip(metrics, highs)}
+
 def draw_team_radar(
-    team_stats: dict,
-    all_teams_df: pd.DataFrame,
-    percentiles: dict,
-    league_avg: dict,
+    values: MetricArrays,
+    radar_scales: Dict[str, Tuple[float, float]],
     team_name: str,
     metric_config: list,
     radar_color: str = '#fbbf24',
@@ -213,39 +560,66 @@ def draw_team_radar(
     Draw a mplsoccer radar chart for team performance.
     
     Args:
-        team_stats: Dictionary of team statistics
-        all_teams_df: DataFrame with all teams' stats for the league
-        percentiles: Dictionary of percentile rankings
-        league_avg: Dictionary of league averages
+        values: Team / league / percentile arrays covering the radar metrics
+        radar_scales: Dictionary of metric -> (min, max) from load_radar_scales
         team_name: Name of the team
         metric_config: List of tuples (metric_key, display_label)
         radar_color: Fill color for team radar (default: gold)
         radar_edge_color: Edge color for team radar (default: orange)
     
     Returns:
-        matplotlib figure object
+        PNG image bytes (rendered once per distinct input, see render_radar_png)
     """
-    metrics = [m[0] for m in metric_config]
-    labels = [m[1] for m in metric_config]
+    metrics, labels = zip(*metric_config)
     
-    # Get actual values
-    team_values = [float(safe_get(team_stats, m, 0)) for m in metrics]
-    league_values = [float(safe_get(league_avg, m, 0)) for m in metrics]
+    # Get actual values (missing -> 0, missing percentile -> 50)
+    radar_values = values.take(metrics)
+    team_values = np.nan_to_num(radar_values.team, nan=0.0)
+    league_values = np.nan_to_num(radar_values.league, nan=0.0)
     
-    # Calculate min/max boundaries for radar (0 to 95th percentile)
-    low = []
-    high = []
-    for metric in metrics:
-        metric_values = all_teams_df[metric].dropna()
-        low.append(0) 
-        high_val = float(metric_values.quantile(0.95))
-        high.append(max(high_val, 0.01))  # Prevent division by zero
+    # Radar boundaries (0 to 95th percentile), split in one pass
+    low, high = zip(*(radar_scales[metric] for metric in metrics))
+    
+    # Calculate percentiles for team performance
+    team_percentiles = np.nan_to_num(radar_values.pct, nan=50.0)
     
+    return render_radar_png(
+        labels,
+        low,
+        high,
+        tuple(team_values.tolist()),
+        tuple(league_values.tolist()),
+        tuple(team_percentiles.tolist()),
+        radar_color,
+        radar_edge_color,
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def render_radar_png(
+    labels: tuple,
+    low: tuple,
+    high: tuple,
+    team_values: tuple,
+    league_values: tuple,
+    team_percentiles: tuple,
+    radar_color: str,
+    radar_edge_color: str,
+) -> bytes:
+    """
+    Render the radar chart to PNG (cached on its inputs).
+    
+    Matplotlib drawing dominates the tab render time, so identical
+    team/league values reuse the cached image across reruns and sessions.
+    """
+    # Imported on first draw: matplotlib/mplsoccer are only needed on a cache miss
+    import matplotlib.pyplot as plt
+    from mplsoccer import Radar
+
     # Initialize Radar
     radar = Radar(
-        params=labels,
-        min_range=low,
-        max_range=high,
+        params=list(labels),
+        min_range=list(low),
+        max_range=list(high),
         num_rings=4, 
         ring_width=1,
         center_circle_radius=0
@@ -273,8 +647,8 @@ def draw_team_radar(
         
         # League Average (background) and Team Performance (foreground)
         league_output = radar.draw_radar_compare(
-            league_values,
-            team_values,
+            list(league_values),
+            list(team_values),
             ax=ax,
             kwargs_radar={
                 'facecolor': '#9ca3af', 
@@ -293,9 +667,6 @@ def draw_team_radar(
     # Get vertices for markers
     radar_poly1, radar_poly2, vertices1, vertices2 = league_output
     
-    # Calculate percentiles for team performance
-    team_percentiles = [float(safe_get(percentiles, m, 50)) for m in metrics]
-    
     # Add markers for team radar
     for vertex, pct in zip(vertices2, team_percentiles):
         # Use lighter shade if above 60th percentile
@@ -328,120 +699,182 @@ def draw_team_radar(
     
     plt.tight_layout(pad=0.65)
     
-    return fig
+    # Same output settings st.pyplot uses
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight')
+    plt.close(fig)
+    
+    return buffer.getvalue()
+
+# Percentile quartile markers: PCT_ICONS[np.digitize(pct, PCT_BINS)]
+PCT_BINS = np.array([25, 50, 75])
+PCT_ICONS = np.array(['🔴', '🟠', '🟡', '🟢'])
 
-def create_stats_table(metrics_config, team_stats, league_avg, percentiles, inverted_metrics=None):
+def fmt_pct_array(values: np.ndarray, invert=False) -> np.ndarray:
+    """
+    Format an array of percentiles as '🟢 NN%' labels with NumPy string ops.
+    
+    The colored marker replaces per-cell Styler highlighting (🟢 >= 75,
+    🟡 >= 50, 🟠 >= 25, 🔴 below). NaN becomes '-'; where invert is True
+    (scalar or per-element mask) the value is shown as 100 - percentile.
+    """
+    values = np.asarray(values, dtype=float)
+    values = np.where(invert, 100 - values, values)
+    
+    missing = np.isnan(values)
+    filled = np.where(missing, 0, values)
+    icons = PCT_ICONS[np.digitize(filled, PCT_BINS)]
+    labels = np.char.add(np.char.add(icons, ' '), np.char.add(filled.astype(int).astype(str), '%'))
+    return np.where(missing, '-', labels)
+
+def round_by_precision(values: np.ndarray, decimals: np.ndarray) -> np.ndarray:
+    """Round each value to its own number of decimals (one np.round per precision)."""
+    rounded = np.empty(len(values), dtype=float)
+    for precision in np.unique(decimals):
+        mask = decimals == precision
+        rounded[mask] = np.round(values[mask], int(precision))
+    return rounded
+
+def format_metric_column(values: np.ndarray, decimals: np.ndarray, is_pct: np.ndarray) -> np.ndarray:
+    """
+    Format a column of metric values with per-row decimals in a single np.char.mod.
+    
+    Each row gets its own printf pattern ('%.2f', '%.1f%%', ...), so the result
+    is a string array straight away, with no object array or per-cell str().
+    
+    Returns:
+        Array of strings; rows flagged in is_pct get a '%' suffix
+    """
+    patterns = np.char.add(np.char.add('%.', decimals.astype(str)), np.where(is_pct, 'f%%', 'f'))
+    return np.char.mod(patterns, values)
+
+def create_stats_table(metrics_config, values: MetricArrays, inverted_metrics=None):
     """
     Create a statistics table DataFrame.
     
     Args:
         metrics_config: List of tuples (metric_key, display_name, decimals)
-        team_stats: Dictionary of team statistics
-        league_avg: Dictionary of league averages
-        percentiles: Dictionary of percentile values
+        values: Team / league / percentile arrays covering the table metrics
         inverted_metrics: List of metric keys where lower is better
     
     Returns:
-        Prepared DataFrame ready for display
+        Display DataFrame (categorical Metric, string value columns);
+        df.attrs['comparison'] holds the Team vs League sign per row
+        (inverted metrics already flipped)
     """
-    inverted_metrics = inverted_metrics or []
-    
-    # Create mapping from metric_key to display_name
-    inverted_names = [
-        name for key, name, _ in metrics_config if key in inverted_metrics
-    ]
+    # Per-metric layout: one pass over the config, then whole-column array ops
+    keys, names, precisions = zip(*metrics_config)
+    is_pct = np.char.endswith(np.array(keys, dtype=str), '_pct')
+    decimals = np.where(is_pct, 1, precisions)
+    invert = np.isin(keys, list(inverted_metrics or []))  # lower is better
     
-    data = {
-        'Metric': [name for _, name, _ in metrics_config],
-        'Team': [
-            format_number(safe_get(team_stats, key), decimals) 
-            if not key.endswith('_pct') 
-            else format_percentage(safe_get(team_stats, key))
-            for key, _, decimals in metrics_config
-        ],
-        'League': [
-            format_number(safe_get(league_avg, key), decimals) 
-            if not key.endswith('_pct') 
-            else format_percentage(safe_get(league_avg, key))
-            for key, _, decimals in metrics_config
-        ],
-        'Percentile': [
-            f"{int(100 - percentiles.get(key, 100)) if key in inverted_metrics else int(percentiles.get(key, 0))}%" 
-            if percentiles.get(key) is not None else '-'
-            for key, _, _ in metrics_config
-        ]
-    }
+    # Keep the numbers: format them for display, compare them as numbers
+    table_values = values.take(keys)
+    team_num = round_by_precision(np.nan_to_num(table_values.team, nan=0.0), decimals)
+    league_num = round_by_precision(np.nan_to_num(table_values.league, nan=0.0), decimals)
+    team_col = format_metric_column(team_num, decimals, is_pct)
+    league_col = format_metric_column(league_num, decimals, is_pct)
     
-    df = pd.DataFrame(data)
-    df_prepared = prepare_dataframe_for_display(df)
+    # Compare displayed (rounded) values: +1 team better, -1 worse, 0 level
+    comparison = np.where(invert, -1, 1) * np.sign(team_num - league_num).astype(int)
     
-    # Store inverted metric names as attribute for styling
-    df_prepared.attrs['inverted_names'] = inverted_names
+    # Columns go in as ready arrays, no intermediate Python lists
+    df = pd.DataFrame({
+        'Metric': pd.Categorical(names),
+        'Team': team_col,
+        'League': league_col,
+        # Missing percentiles stay NaN ('-'); inverted metrics show 100 - percentile
+        'Percentile': fmt_pct_array(table_values.pct, invert=invert),
+    })
+    df.attrs['comparison'] = comparison.tolist()
     
-    return df_prepared
+    return df
+
+# Team cell style by comparison with the league (+1 better, -1 worse, 0 level)
+# indexed by sign + 1, so a whole column of signs maps to styles in one gather
+TEAM_CELL_STYLES = np.array([
+    'color: #d3001c; font-weight: bold',  # -1: worse
+    'font-weight: bold',                  #  0: level
+    'color: #178800; font-weight: bold',  # +1: better
+])
 
-def style_table(row, inverted_metrics=None):
+def render_stats_table_html(df: pd.DataFrame) -> str:
     """
-    Style table rows with color coding.
+    Build a static HTML table from a create_stats_table DataFrame.
     
-    Args:
-        row: DataFrame row
-        inverted_metrics: List of metric names where lower is better
+    The tables are small and read-only, so plain HTML via st.markdown avoids
+    the Arrow serialization round trip of st.dataframe.
     
     Returns:
-        List of style strings for each column
+        HTML string (uses the .stats-table styles defined at the top of the page)
     """
-    inverted_metrics = inverted_metrics or []
-    colors = [''] * len(row)
-    
-    metric_name = row['Metric']
-    is_inverted = metric_name in inverted_metrics
-    
-    # Compare Team vs League and apply color + bold to Team column (index 1)
-    try:
-        team_val_str = row['Team']
-        league_val_str = row['League']
-        
-        # Remove any formatting and convert to float for comparison
-        team_val = float(team_val_str.replace(',', '').replace('-', '0').replace('%', ''))
-        league_val = float(league_val_str.replace(',', '').replace('-', '0').replace('%', ''))
-        
-        # For inverted metrics, reverse the color logic
-        if is_inverted:
-            if team_val < league_val:  # Lower is better
-                colors[1] = 'color: #178800; font-weight: bold'  # Green
-            elif team_val > league_val:  # Higher is worse
-                colors[1] = 'color: #d3001c; font-weight: bold'  # Red
-            else:
-                colors[1] = 'font-weight: bold'
-        else:
-            if team_val > league_val:  # Higher is better
-                colors[1] = 'color: #178800; font-weight: bold'  # Green
-            elif team_val < league_val:  # Lower is worse
-                colors[1] = 'color: #d3001c; font-weight: bold'  # Red
-            else:
-                colors[1] = 'font-weight: bold'
-    except:
-        colors[1] = 'font-weight: bold'
-    
-    # Color code the Percentile column (index -1)
-    pct_str = row['Percentile']
-    if pct_str != '-':
-        try:
-            pct_val = int(pct_str.replace('%', ''))
-            
-            if pct_val >= 75:
-                colors[-1] = 'background-color: #dcfce7; color: #166534; font-weight: bold'
-            elif pct_val >= 50:
-                colors[-1] = 'background-color: #fef3c7; color: #854d0e; font-weight: bold'
-            elif pct_val >= 25:
-                colors[-1] = 'background-color: #fed7aa; color: #9a3412; font-weight: bold'
-            else:
-                colors[-1] = 'background-color: #fee2e2; color: #991b1b; font-weight: bold'
-        except:
-            pass
-    
-    return colors
+    comparison = np.asarray(df.attrs.get('comparison', [0] * len(df)), dtype=int)
+    team_styles = TEAM_CELL_STYLES[comparison + 1]
+    header = ''.join(f'<th>{column}</th>' for column in df.columns)
+    rows = '\n'.join(
+        f"<tr><td>{metric}</td><td style='{style}'>{team}</td>"
+        f"<td>{league}</td><td>{pct}</td></tr>"
+        for metric, team, league, pct, style in zip(
+            df['Metric'], df['Team'], df['League'], df['Percentile'], team_styles
+        )
+    )
+    return f"<table class='stats-table'><thead><tr>{header}</tr></thead><tbody>{rows}</tbody></table>"
+
+# Team stat column -> mart_league_averages column, per stat type.
+# Built once at import; map_league_averages only reads it.
+LEAGUE_AVG_MAPPINGS = {
+    'attack': {
+        'goals_per_game': 'avg_goals_per_game_per_team',
+        'xg_per_game': 'avg_xg_per_game',
+        'xg_difference': 'avg_xg_difference',
+        'xg_diff_per_game': 'avg_xg_diff_per_game',
+        'big_chances_created_per_game': 'avg_big_chances_created_per_game',
+        'big_chances_missed_per_game': 'avg_big_chances_missed_per_game',
+        'big_chances_scored_per_game': 'avg_big_chances_scored_per_game',
+        'shots_per_game': 'avg_shots_per_game',
+        'shots_on_target_per_game': 'avg_shots_on_target_per_game',
+        'shots_off_target_per_game': 'avg_shots_off_target_per_game',
+        'blocked_shots_per_game': 'avg_blocked_shots_per_game',
+        'shots_inside_box_per_game': 'avg_shots_inside_box_per_game',
+        'shots_outside_box_per_game': 'avg_shots_outside_box_per_game',
+        'corners_per_game': 'avg_corners_per_game',
+        'touches_in_box_per_game': 'avg_touches_in_box_per_game',
+    },
+    'defense': {
+        'goals_conceded_per_game': 'avg_goals_conceded_per_game',
+        'xga_per_game': 'avg_xga_per_game',
+        'xga_difference': 'avg_xga_difference',
+        'xga_difference_per_game': 'avg_xga_difference_per_game',
+        'clean_sheet_pct': 'avg_clean_sheet_pct',
+        'saves_per_game': 'avg_saves_per_game',
+        'tackles_per_game': 'avg_tackles_per_game',
+        'avg_tackles_won_pct': 'avg_tackles_won_pct',
+        'interceptions_per_game': 'avg_interceptions_per_game',
+        'clearances_per_game': 'avg_clearances_per_game',
+        'blocked_shots_per_game': 'avg_blocked_shots_per_game_def',
+        'ball_recoveries_per_game': 'avg_ball_recoveries_per_game',
+        'avg_aerial_duels_pct': 'avg_aerial_duels_pct',
+        'avg_ground_duels_pct': 'avg_ground_duels_pct',
+        'avg_duels_won_pct': 'avg_duels_won_pct',
+    },
+    'possession': {
+        'avg_possession_pct': 'avg_possession_pct',
+        'pass_accuracy_pct': 'avg_pass_accuracy_pct',
+        'accurate_passes_per_game': 'avg_accurate_passes_per_game',
+        'total_passes_per_game': 'avg_total_passes_per_game',
+        'accurate_long_balls_per_game': 'avg_accurate_long_balls_per_game',
+        'accurate_crosses_per_game': 'avg_accurate_crosses_per_game',
+        'final_third_entries_per_game': 'avg_final_third_entries_per_game',
+        'touches_in_box_per_game': 'avg_touches_in_box_per_game_poss',
+        'dispossessed_per_game': 'avg_dispossessed_per_game',
+    },
+    'discipline': {
+        'yellow_cards_per_game': 'avg_yellow_cards_per_game',
+        'fouls_per_game': 'avg_fouls_per_game',
+        'offsides_per_game': 'avg_offsides_per_game',
+        'free_kicks_per_game': 'avg_free_kicks_per_game',
+    }
+}
 
 def map_league_averages(league_averages: Dict[str, Any], stat_type: str) -> Dict[str, float]:
     """
@@ -457,70 +890,107 @@ def map_league_averages(league_averages: Dict[str, Any], stat_type: str) -> Dict
     if not league_averages:
         return {}
     
-    # Define mappings for each stat type
-    mappings = {
-        'attack': {
-            'goals_per_game': 'avg_goals_per_game_per_team',
-            'xg_per_game': 'avg_xg_per_game',
-            'xg_difference': 'avg_xg_difference',
-            'xg_diff_per_game': 'avg_xg_diff_per_game',
-            'big_chances_created_per_game': 'avg_big_chances_created_per_game',
-            'big_chances_missed_per_game': 'avg_big_chances_missed_per_game',
-            'big_chances_scored_per_game': 'avg_big_chances_scored_per_game',
-            'shots_per_game': 'avg_shots_per_game',
-            'shots_on_target_per_game': 'avg_shots_on_target_per_game',
-            'shots_off_target_per_game': 'avg_shots_off_target_per_game',
-            'blocked_shots_per_game': 'avg_blocked_shots_per_game',
-            'shots_inside_box_per_game': 'avg_shots_inside_box_per_game',
-            'shots_outside_box_per_game': 'avg_shots_outside_box_per_game',
-            'corners_per_game': 'avg_corners_per_game',
-            'touches_in_box_per_game': 'avg_touches_in_box_per_game',
-        },
-        'defense': {
-            'goals_conceded_per_game': 'avg_goals_conceded_per_game',
-            'xga_per_game': 'avg_xga_per_game',
-            'xga_difference': 'avg_xga_difference',
-            'xga_difference_per_game': 'avg_xga_difference_per_game',
-            'clean_sheet_pct': 'avg_clean_sheet_pct',
-            'saves_per_game': 'avg_saves_per_game',
-            'tackles_per_game': 'avg_tackles_per_game',
-            'avg_tackles_won_pct': 'avg_tackles_won_pct',
-            'interceptions_per_game': 'avg_interceptions_per_game',
-            'clearances_per_game': 'avg_clearances_per_game',
-            'blocked_shots_per_game': 'avg_blocked_shots_per_game_def',
-            'ball_recoveries_per_game': 'avg_ball_recoveries_per_game',
-            'avg_aerial_duels_pct': 'avg_aerial_duels_pct',
-            'avg_ground_duels_pct': 'avg_ground_duels_pct',
-            'avg_duels_won_pct': 'avg_duels_won_pct',
-        },
-        'possession': {
-            'avg_possession_pct': 'avg_possession_pct',
-            'pass_accuracy_pct': 'avg_pass_accuracy_pct',
-            'accurate_passes_per_game': 'avg_accurate_passes_per_game',
-            'total_passes_per_game': 'avg_total_passes_per_game',
-            'accurate_long_balls_per_game': 'avg_accurate_long_balls_per_game',
-            'accurate_crosses_per_game': 'avg_accurate_crosses_per_game',
-            'final_third_entries_per_game': 'avg_final_third_entries_per_game',
-            'touches_in_box_per_game': 'avg_touches_in_box_per_game_poss',
-            'dispossessed_per_game': 'avg_dispossessed_per_game',
-        },
-        'discipline': {
-            'yellow_cards_per_game': 'avg_yellow_cards_per_game',
-            'fouls_per_game': 'avg_fouls_per_game',
-            'offsides_per_game': 'avg_offsides_per_game',
-            'free_kicks_per_game': 'avg_free_kicks_per_game',
-        }
+    # One comprehension over the module-level mapping; missing/None averages are skipped
+    return {
+        team_col: float(value)
+        for team_col, league_col in LEAGUE_AVG_MAPPINGS.get(stat_type, {}).items()
+        if (value := league_averages.get(league_col)) is not None
     }
+
+def render_stat_tab(
+    spec: StatTabSpec,
+    season_id: int,
+    team_stats: Dict[str, Any],
+    all_teams_df: pd.DataFrame,
+    league_averages: Dict[str, Any],
+    team_name: str
+):
+    """
+    Render a radar chart and a stats table for one stat category.
+    
+    Args:
+        spec: Tab configuration (metrics, colors, inverted metrics)
+        season_id: Selected season (cache key for radar scales and percentiles)
+        team_stats: Selected team's statistics for this category
+        all_teams_df: All teams' statistics for the season (percentiles, radar scales)
+        league_averages: League averages (from mart_league_averages)
+        team_name: Name of the selected team
+    """
+    if not isinstance(all_teams_df, pd.DataFrame) or all_teams_df.empty or not team_stats:
+        st.warning(f"No {spec.stat_type} statistics available for this team.")
+        return
+    
+    # Calculate percentiles using pre-loaded data (means and ranks cached per season)
+    league_avg, percentiles = lazy_calculate_league_stats_and_percentiles(
+        all_teams_df,
+        team_stats,
+        load_league_means(season_id, spec.stat_type, all_teams_df),
+        load_league_percentiles(season_id, spec.stat_type, all_teams_df)
+    )
+    
+    # Override with actual league averages using mapped column names
+    league_avg.update(map_league_averages(league_averages, spec.stat_type))
     
-    mapping = mappings.get(stat_type, {})
+    # One array view of the three dicts, shared by the radar and the table
+    values = MetricArrays.from_stats(
+        [m[0] for m in spec.radar_metrics] + [m[0] for m in spec.table_metrics],
+        team_stats,
+        league_avg,
+        percentiles,
+    )
+    
+    # Layout with radar and stats table
+    col1, col2 = st.columns([1.2, 1])
     
-    # Map the values
-    mapped_averages = {}
-    for team_col, league_col in mapping.items():
-        if league_col in league_averages and league_averages[league_col] is not None:
-            mapped_averages[team_col] = float(league_averages[league_col])
+    with col1:
+        st.markdown(f"### {spec.title} Radar")
+        
+        radar_scales = load_radar_scales(
+            season_id,
+            spec.stat_type,
+            tuple(m[0] for m in spec.radar_metrics),
+            all_teams_df
+        )
+        radar_png = draw_team_radar(
+            values=values,
+            radar_scales=radar_scales,
+            team_name=team_name,
+            metric_config=spec.radar_metrics,
+            radar_color=spec.radar_color,
+            radar_edge_color=spec.radar_edge_color
+        )
+        
+        radar_col1, radar_col2, radar_col3 = st.columns([0.3, 1, 0.3])
+        with radar_col2:
+            st.image(radar_png, width='stretch')
+        
+        # Legend
+        st.markdown(f"""
+        <div style="display: flex; justify-content: center; gap: 15px; margin-top: 8px; font-size: 11px;">
+            <div style="display: flex; align-items: center;">
+                <div style="width: 14px; height: 14px; background-color: {spec.radar_color}; margin-right: 5px; border-radius: 2px;"></div>
+                <span>{team_name}</span>
+            </div>
+            <div style="display: flex; align-items: center;">
+                <div style="width: 14px; height: 14px; background-color: #9ca3af; margin-right: 5px; border-radius: 2px;"></div>
+                <span>League Average</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
     
-    return mapped_averages
+    with col2:
+        render_stats_section(spec, values)
+
+def render_stats_section(spec: StatTabSpec, values: MetricArrays):
+    """Render the '<title> Statistics' heading and table shared by all stat tabs."""
+    st.markdown(f"### {spec.title} Statistics")
+    
+    stats_df = create_stats_table(
+        spec.table_metrics,
+        values,
+        spec.inverted_metrics
+    )
+    st.markdown(render_stats_table_html(stats_df), unsafe_allow_html=True)
 
 @time_page_load
 def teams():
@@ -540,6 +1010,10 @@ def teams():
 
     with st.sidebar:
         st.header("Filters")
+
+        from components.errors import error_details_toggle, show_error
+
+        show_error_details = error_details_toggle()
         
         # Season selector
         try:
@@ -573,21 +1047,18 @@ def teams():
 
     # Load league standings for team selection
         try:
-            from services.queries import get_league_standings, get_all_team_stats, get_league_averages
+            from services.queries import get_all_team_stats
 
-            standings_df = get_league_standings(selected_season_id)
+            # Season-wide data for the header and every tab, loaded together
+            season_bundle = load_season_bundle(selected_season_id)
+            standings_df = season_bundle['standings']
         
             if standings_df.empty:
                 st.warning(f"No team data available for season: {selected_season_name}")
                 st.stop()
-        
-            # Add position column (rank by points, goal difference, goals for)
-            standings_df = standings_df.sort_values(
-                by=['total_points', 'goal_difference', 'goals_for'],
-                ascending=[False, False, False]
-            ).reset_index(drop=True)
 
-            standings_df['position'] = standings_df.index + 1
+            # Ranked and indexed by team_id once per season (load_ranked_standings):
+            # the selected row is a hash lookup, not a boolean mask over the table
 
             # Team selector
             from components.filters import team_selector
@@ -603,24 +1074,21 @@ def teams():
                 st.stop()
 
             # Get selected team info
-            team_filtered = standings_df[standings_df['team_id'] == selected_team_id]
-
-            if team_filtered.empty:
+            if selected_team_id not in standings_df.index:
                 # Get the team name from session state if available
                 team_name = st.session_state.get('teams_team_selector_name', 'Selected team')
                 st.warning(f"⚠️ **{team_name}** did not play in Ekstraklasa during the **{selected_season_name}** season.")
                 st.info("👆 Please select a different team or change the season.")
                 st.stop()
 
-            team_row = team_filtered.iloc[0]
+            # Plain dict: the header reads several fields, dict.get beats Series.get
+            team_row = standings_df.loc[selected_team_id].to_dict()
             team_name = team_row['team_name']
             team_position = int(team_row['position'])
             total_teams = len(standings_df)
             
         except Exception as e:
-            logger.error(f"Failed to load teams: {e}")
-            st.error(f"Failed to load team data: {e}")
-            st.exception(e)
+            show_error("Failed to load team data", e, detail=show_error_details)
             st.stop()
 
         st.markdown("---")
@@ -631,7 +1099,12 @@ def teams():
 
     st.markdown(f'<div class="team-name-box">{team_name}</div>', unsafe_allow_html=True)
 
-    # Quick stats header
+    # Quick stats header: convert every value once, then just place the boxes
+    season_matches = int(team_row.get("matches_played", 0))
+    season_points = int(team_row.get("total_points", 0))
+    season_ppg = format_number(team_row.get("points_per_game"), 2)
+    season_goal_diff = int(team_row.get("goal_difference", 0))
+
     with st.container():
         col1, col2, col3, col4, col5 = st.columns(5)
 
@@ -645,25 +1118,25 @@ def teams():
         with col2:
             render_stat_box(
                 "Matches played",
-                int(team_row.get("matches_played", 0))
+                season_matches
             )
 
         with col3:
             render_stat_box(
                 "Points",
-                int(team_row.get("total_points", 0))
+                season_points
             )
 
         with col4:
             render_stat_box(
                 "Points per Game",
-                format_number(team_row.get("points_per_game"), 2)
+                season_ppg
             )
 
         with col5:
             render_stat_box(
                 "Goal Diff",
-                f"{int(team_row.get('goal_difference', 0)):+d}",
+                f"{season_goal_diff:+d}",
                 help_text="Goals scored minus goals conceded"
             )
 
@@ -674,8 +1147,7 @@ def teams():
     # Initialize all variables
 
     attack_stats = defense_stats = possession_stats = discipline_stats = overview_stats = btts_stats = {}
-    all_teams_attack = all_teams_defense = all_teams_possession = all_teams_discipline = pd.DataFrame()
-    league_averages = {}
+    league_averages = season_bundle['league_averages'] or {}
 
     try:
         # Get selected team's stats in one database call
@@ -687,18 +1159,6 @@ def teams():
         discipline_stats = all_stats.get('discipline', {})
         overview_stats = all_stats.get('overview', {})
         btts_stats = all_stats.get('btts', {})
-        
-        # Get league averages
-        league_averages = get_league_averages(selected_season_id)
-        
-        # Get ALL teams' data for percentile calculations in ONE bulk call
-        from services.queries import get_bulk_league_stats
-        league_stats = get_bulk_league_stats(selected_season_id)
-        
-        all_teams_attack = league_stats.get('attack', pd.DataFrame())
-        all_teams_defense = league_stats.get('defense', pd.DataFrame())
-        all_teams_possession = league_stats.get('possession', pd.DataFrame())
-        all_teams_discipline = league_stats.get('discipline', pd.DataFrame())
 
     except Exception as e:
         logger.error(f"Error loading team stats: {e}")
@@ -708,6 +1168,16 @@ def teams():
     # TABS LAYOUT
     # ============================================================================
 
+    # on_change="rerun" tracks the selected tab, so only the open tab's body
+    # runs (tab.open); the others are not queried or drawn on this rerun.
+    # bind="query-params" keeps the active tab in the URL (?teams_active_tab=Form),
+    # so a reload or shared link reopens the same tab without an extra rerun.
+    # Widgets in closed tabs are not rendered, so carry their state over.
+    if "teams_form_window" in st.session_state:
+        st.session_state["teams_form_window"] = st.session_state["teams_form_window"]
+    # The footer shows the form window on every tab, not only when Form is open
+    form_window = st.session_state.get("teams_form_window", 5)
+
     overview_tab, form_tab, attack_tab, defense_tab, possession_tab, discipline_tab = st.tabs([
         "Overview",
         "Form",
@@ -715,571 +1185,188 @@ def teams():
         "Defense",
         "Possession",
         "Discipline"
-    ])
+    ], key="teams_active_tab", on_change="rerun", bind="query-params")
 
     # ============================================================================
     # OVERVIEW TAB
     # ============================================================================
 
     with overview_tab:
-        try:
-            if attack_stats and defense_stats:
-                with st.expander("General stats", expanded=True):
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        render_stat_box("Goals for", int(safe_get(attack_stats, "total_goals", 0)))
-                        render_stat_box("Total xG", float(safe_get(attack_stats, "total_xg", 0)))
-                        render_stat_box("xG Diff", float(safe_get(attack_stats, "xg_difference", 0)))
-                    
-                    with col2:
-                        render_stat_box("Goals against", int(safe_get(defense_stats, "total_goals_conceded", 0)))
-                        render_stat_box("Total xGA", format_number(safe_get(defense_stats, "total_xga", 0)))
-                        render_stat_box("xGA Diff", format_number(safe_get(defense_stats, "xga_difference", 0)))
-                        
-                    with col3:
-                        render_stat_box("Clean Sheets", int(safe_get(defense_stats, "clean_sheets", 0)))
-                        render_stat_box("Clean Sheets %", format_percentage(safe_get(defense_stats, "clean_sheet_pct", 0)))
-                        
-            if btts_stats:
-                with st.expander("BTTS Statistics", expanded=True):
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        render_stat_box("AVG Goals per Match", float(safe_get(btts_stats, "overall_avg_goals_per_match", 0)))
-                        render_stat_box("BTTS %", format_percentage(safe_get(btts_stats, "overall_btts_pct", 0)))
+        if overview_tab.open:
+            try:
+                has_general = bool(attack_stats and defense_stats)
+
+                # Nothing to show: warn before creating any expanders or columns
+                if not (has_general or btts_stats):
+                    st.warning("No overview statistics available for this team.")
+                
+                if has_general:
+                    with st.expander("General stats", expanded=True):
+                        cols = st.columns(4)
+                        render_stat_columns(cols[:1], attack_stats, OVERVIEW_ATTACK_BOXES)
+                        render_stat_columns(cols[1:], defense_stats, OVERVIEW_DEFENSE_BOXES)
                         
-                    with col2:
-                        render_stat_box("AVG Goals For", float(safe_get(btts_stats, "overall_avg_scored", 0)))
-                        render_stat_box("AVG xG per Match", float(safe_get(btts_stats, "overall_avg_xg", 0)))
-                    with col3:
-                        render_stat_box("AVG Goals Against", float(safe_get(btts_stats, "overall_avg_conceded", 0)))
-                        render_stat_box("AVG xGA per Match", float(safe_get(btts_stats, "overall_avg_xga", 0)))
-            
-            else:
-                st.warning("No overview statistics available for this team.")
-        except Exception as e:
-            logger.error(f"Error loading overview stats: {e}")
-            st.error(f"Failed to load overview statistics: {e}")
+                if btts_stats:
+                    with st.expander("BTTS Statistics", expanded=True):
+                        render_stat_columns(st.columns(4), btts_stats, OVERVIEW_BTTS_BOXES)
+            except Exception as e:
+                logger.error(f"Error loading overview stats: {e}")
+                st.error(f"Failed to load overview statistics: {e}")
 
     # ============================================================================
     # FORM TAB
     # ============================================================================
 
     with form_tab:
-        st.subheader("Recent Form")
-
-        # Time period selector
-        form_window = st.select_slider(
-            "Form window (matches)",
-            options=[5, 10, 15, 20],
-            value=5,
-            key="teams_form_window",
-            help="Number of recent matches to analyze",
-        )
-        try:
-            form_data = lazy_get_team_form(selected_team_id, last_n_matches=form_window)
-
-            if form_data:
-                # Use dynamic key 'last_results' instead of hardcoded "last_5_results"
-                form_string = safe_get(form_data, "last_results", "")
-                results_list = parse_form_results(form_string, form_window)
-
-                if results_list:
-                    # Visual form indicator (unchanged)
-                    colors = {"W": "#22c55e", "D": "#eab308", "L": "#ef4444"}
-                    form_html = ""
-                    for result in results_list:
-                        color = colors.get(result, "#6b7280")
-                        form_html += (
-                            f'<span style="display:inline-block; width:40px; height:40px; '
-                            f'background-color:{color}; color:white; text-align:center; '
-                            f'line-height:40px; margin:2px; border-radius:5px; '
-                            f'font-weight:bold; font-size:16px;">{result}</span>'
-                        )
-
-                    st.markdown(form_html, unsafe_allow_html=True)
-                    st.caption("W = Win | D = Draw | L = Loss (most recent on left)")
-
-                    wins = results_list.count("W")
-                    draws = results_list.count("D")
-                    losses = results_list.count("L")
-
-                    # Compact metrics row
-                    with st.container():
-                        m1, m2, m3 = st.columns(3)
-                        with m1:
-                            render_stat_box("Wins", wins)
-                        with m2:
-                            render_stat_box("Draws", draws)
-                        with m3:
-                            render_stat_box("Losses", losses)
-
-                    # Charts section (unchanged)
-                    col1, col2 = st.columns([2, 1])
-
-                    points_list = results_to_points(results_list)
-                    match_numbers = list(range(1, len(points_list) + 1))
-                    form_df = pd.DataFrame(
-                        {"Match": match_numbers, "Points": points_list, "Result": results_list}
-                    )
-
-                    with col1:
-                        st.markdown("#### Points per match")
-                        fig = px.line(
-                            form_df,
-                            x="Match",
-                            y="Points",
-                            markers=True,
-                            labels={"Match": "Match", "Points": "Points"},
-                        )
-                        fig.update_traces(marker=dict(size=8), line=dict(width=2))
-                        fig.update_layout(
-                            height=350,
-                            yaxis=dict(range=[-0.5, 3.5], tickvals=[0, 1, 3]),
-                            hovermode="x unified",
+        if form_tab.open:
+            st.subheader("Recent Form")
+
+            # Time period selector
+            form_window = st.select_slider(
+                "Form window (matches)",
+                options=[5, 10, 15, 20],
+                value=5,
+                key="teams_form_window",
+                help="Number of recent matches to analyze",
+            )
+            try:
+                form_data = lazy_get_team_form(selected_team_id, last_n_matches=form_window)
+
+                if form_data:
+                    # Use dynamic key 'last_results' instead of hardcoded "last_5_results"
+                    results_list = parse_form_results(form_data.get("last_results"), form_window)
+
+                    if results_list:
+                        # Visual form indicator
+                        st.image(form_svg(tuple(results_list)))
+                        st.caption("W = Win | D = Draw | L = Loss (most recent on left)")
+
+                        # One pass over the results for the stat boxes
+                        result_counts = Counter(results_list)
+                        wins, draws, losses = result_counts["W"], result_counts["D"], result_counts["L"]
+
+                        # Compact metrics row
+                        with st.container():
+                            m1, m2, m3 = st.columns(3)
+                            with m1:
+                                render_stat_box("Wins", wins)
+                            with m2:
+                                render_stat_box("Draws", draws)
+                            with m3:
+                                render_stat_box("Losses", losses)
+
+                        # Charts section: line + pie in one figure (single payload),
+                        # built once per (results, team) and reused across reruns
+                        fig = form_chart_figure(tuple(results_list), str(selected_team_id))
+                        # Stable key: the chart is updated in place when the team or
+                        # window changes instead of being re-mounted
+                        st.plotly_chart(
+                            fig,
+                            width='stretch',
+                            config={"displayModeBar": False, "responsive": True},
+                            key="team_form_chart",
                         )
-                        st.plotly_chart(fig, width='stretch')
 
-                    with col2:
-                        st.markdown("#### Result distribution")
-                        wdl_df = pd.DataFrame(
-                            {"Result": ["Wins", "Draws", "Losses"], "Count": [wins, draws, losses]}
-                        )
-                        fig_pie = px.pie(
-                            wdl_df,
-                            values="Count",
-                            names="Result",
-                            color="Result",
-                            color_discrete_map={
-                                "Wins": "#22c55e",
-                                "Draws": "#eab308",
-                                "Losses": "#ef4444",
-                            },
-                        )
-                        fig_pie.update_traces(textinfo="value+percent")
-                        fig_pie.update_layout(height=350)
-                        st.plotly_chart(fig_pie, width='stretch')
-
-                    # Additional form metrics in one compact row (updated to use dynamic keys)
-                    total_points = safe_get(form_data, "points_last", 0)
-                    goals_for = safe_get(form_data, "goals_for_last", 0)
-                    goals_against = safe_get(form_data, "goals_against_last", 0)
-                    goal_diff = goals_for - goals_against
-
-                    with st.container():
-                        c1, c2, c3, c4 = st.columns(4)
-                        with c1:
-                            render_stat_box("Total points", int(total_points))
-                        with c2:
-                            render_stat_box("Goals scored", int(goals_for))
-                        with c3:
-                            render_stat_box("Goals conceded", int(goals_against))
-                        with c4:
-                            render_stat_box("Goal diff", f"{int(goal_diff):+d}")
+                        # Additional form metrics in one compact row (one bulk extraction, ints bound once)
+                        total_points, goals_for, goals_against = metric_values(
+                            form_data, ["points_last", "goals_for_last", "goals_against_last"]
+                        ).astype(int).tolist()
+
+                        with st.container():
+                            c1, c2, c3, c4 = st.columns(4)
+                            with c1:
+                                render_stat_box("Total points", total_points)
+                            with c2:
+                                render_stat_box("Goals scored", goals_for)
+                            with c3:
+                                render_stat_box("Goals conceded", goals_against)
+                            with c4:
+                                render_stat_box("Goal diff", f"{goals_for - goals_against:+d}")
+                    else:
+                        st.info("No recent form data available.")
                 else:
-                    st.info("No recent form data available.")
-            else:
-                st.warning("No form data available for this team.")
-        except Exception as e:
-            logger.error(f"Error loading form data: {e}")
-            st.error(f"Failed to load form data: {e}")
+                    st.warning("No form data available for this team.")
+            except Exception as e:
+                logger.error(f"Error loading form data: {e}")
+                st.error(f"Failed to load form data: {e}")
 
     # ============================================================================
-    # ATTACK TAB
+    # ATTACK / DEFENSE / POSSESSION TABS
     # ============================================================================
 
-    with attack_tab:
-        try:
-            if isinstance(all_teams_attack, pd.DataFrame) and not all_teams_attack.empty and attack_stats:
-                # Calculate percentiles using pre-loaded data
-                league_avg_attack, percentiles = lazy_calculate_league_stats_and_percentiles(
-                    all_teams_attack, 
-                    attack_stats,       
-                    None     
-                )
-
-                # Override with actual league averages using mapped column names
-                mapped_league_avg = map_league_averages(league_averages, 'attack')
-                league_avg_attack.update(mapped_league_avg)
-                    
-                # Layout with radar and stats table
-                col1, col2 = st.columns([1.2, 1])
-                    
-                with col1:
-                    st.markdown("### Attack Radar")
-                        
-                    # Metric configuration
-                    attack_radar_metrics = [
-                        ('goals_per_game', 'Goals/Game'),
-                        ('xg_per_game', 'xG/Game'),
-                        ('shots_per_game', 'Shots/Game'),
-                        ('shots_on_target_per_game', 'Shots on Target/Game'),
-                        ('big_chances_created_per_game', 'Big Chances/Game'),
-                        ('touches_in_box_per_game', 'Touches In Box/Game'),
-                    ]
-                    
-                    # Draw radar using reusable function
-                    fig = draw_team_radar(
-                        team_stats=attack_stats,           # Selected team's stats
-                        all_teams_df=all_teams_attack,     # ALL teams for percentile calculation
-                        percentiles=percentiles,            # Calculated percentiles
-                        league_avg=league_avg_attack,      # League averages
-                        team_name=team_name,
-                        metric_config=attack_radar_metrics,
-                        radar_color='#fbbf24',  # Gold
-                        radar_edge_color='#f59e0b'  # Orange
-                    )
-                    
-                    # Display radar
-                    radar_col1, radar_col2, radar_col3 = st.columns([0.3, 1, 0.3])
-                    with radar_col2:
-                        st.pyplot(fig, width='stretch')
-                    plt.close()
-                    
-                    # Legend
-                    st.markdown(f"""
-                    <div style="display: flex; justify-content: center; gap: 15px; margin-top: 8px; font-size: 11px;">
-                        <div style="display: flex; align-items: center;">
-                            <div style="width: 14px; height: 14px; background-color: #fbbf24; margin-right: 5px; border-radius: 2px;"></div>
-                            <span>{team_name}</span>
-                        </div>
-                        <div style="display: flex; align-items: center;">
-                            <div style="width: 14px; height: 14px; background-color: #9ca3af; margin-right: 5px; border-radius: 2px;"></div>
-                            <span>League Average</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                with col2:
-                    st.markdown("### Attack Statistics")
-                    
-                    attack_metrics = [
-                        ('goals_per_game', 'Goals per Game', 2),
-                        ('total_goals', 'Total Goals', 0),
-                        ('xg_per_game', 'xG per Game', 2),
-                        ('total_xg', 'Total xG', 2),
-                        ('xg_difference', 'xG Difference', 2),
-                        ('shots_per_game', 'Shots per Game', 2),
-                        ('shots_on_target_per_game', 'Shots on Target/Game', 2),
-                        ('big_chances_created_per_game', 'Big Chances/Game', 2),
-                        ('big_chances_scored_per_game', 'Big Chances Scored/Game', 2),
-                        ('corners_per_game', 'Corners per Game', 2),
-                        ('touches_in_box_per_game', 'Touches in Box/Game', 2)
-                    ]
-                    
-                    # Create stats table (no inverted metrics for attack)
-                    attack_df = create_stats_table(
-                        attack_metrics, 
-                        attack_stats,           # Selected team's stats
-                        league_avg_attack,      # League averages
-                        percentiles             # Calculated percentiles
-                    )
-                    
-                    inverted_names = attack_df.attrs.get('inverted_names', [])
-                    styled_df = attack_df.style.apply(lambda row: style_table(row, inverted_names), axis=1)
-                    st.dataframe(styled_df, width='stretch', height=425, hide_index=True)
-            else:
-                st.warning("No attack statistics available for this team.")
-                                
-        except Exception as e:
-            logger.error(f"Error loading attack stats: {e}")
-            st.error(f"Failed to load attack statistics: {e}")
-            st.exception(e)
-
-    # ============================================================================
-    # DEFENSE TAB
-    # ============================================================================
-
-    with defense_tab:
-        try:
-            if isinstance(all_teams_defense, pd.DataFrame) and defense_stats:
-                # Calculate percentiles using pre-loaded data
-                league_avg_defense, percentiles = lazy_calculate_league_stats_and_percentiles(
-                    all_teams_defense, 
-                    defense_stats,       
-                    None     
-                )
-                
-                # Override with actual league averages using mapped column names
-                mapped_league_avg = map_league_averages(league_averages, 'defense')
-                league_avg_defense.update(mapped_league_avg)
-
-                # Layout with radar and stats table
-                col1, col2 = st.columns([1.2, 1])
-                
-                with col1:
-                    st.markdown("### Defense Radar")
-                    
-                    defense_radar_metrics = [
-                        ('tackles_per_game', 'Tackles/Game'),
-                        ('interceptions_per_game', 'Interceptions/Game'),
-                        ('clearances_per_game', 'Clearances/Game'),
-                        ('blocked_shots_per_game', 'Blocked Shots/Game'),
-                        ('ball_recoveries_per_game', 'Ball Recoveries/Game'),
-                        ('clean_sheet_pct', 'Clean Sheet %'),
-                    ]
-                    
-                    # Draw radar with RED color scheme
-                    fig = draw_team_radar(
-                        team_stats=defense_stats,
-                        all_teams_df=all_teams_defense,
-                        percentiles=percentiles,
-                        league_avg=league_avg_defense,
-                        team_name=team_name,
-                        metric_config=defense_radar_metrics,
-                        radar_color='#ef4444',  # Red
-                        radar_edge_color='#dc2626'  # Dark red
-                    )
-                    
-                    radar_col1, radar_col2, radar_col3 = st.columns([0.3, 1, 0.3])
-                    with radar_col2:
-                        st.pyplot(fig, width='stretch')
-                    plt.close()
-                    
-                    # Legend with red color
-                    st.markdown(f"""
-                    <div style="display: flex; justify-content: center; gap: 15px; margin-top: 8px; font-size: 11px;">
-                        <div style="display: flex; align-items: center;">
-                            <div style="width: 14px; height: 14px; background-color: #ef4444; margin-right: 5px; border-radius: 2px;"></div>
-                            <span>{team_name}</span>
-                        </div>
-                        <div style="display: flex; align-items: center;">
-                            <div style="width: 14px; height: 14px; background-color: #9ca3af; margin-right: 5px; border-radius: 2px;"></div>
-                            <span>League Average</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+    for tab, spec, team_stats in [
+        (attack_tab, ATTACK_TAB, attack_stats),
+        (defense_tab, DEFENSE_TAB, defense_stats),
+        (possession_tab, POSSESSION_TAB, possession_stats),
+    ]:
+        if not tab.open:
+            continue
+        with tab:
+            if not team_stats:
+                # Skip the league frame lookup and layout for teams without rows this season
+                st.warning(f"No {spec.stat_type} statistics available for this team.")
+                continue
+            try:
+                # ALL teams' data for percentiles and radar scales, from the
+                # season bundle (one joined query, only the columns the tabs use)
+                all_teams_df = season_bundle['league_stats'].get(spec.stat_type, pd.DataFrame())
                 
-                with col2:
-                    st.markdown("### Defense Statistics")
-                    
-                    defense_metrics = [
-                        ('goals_conceded_per_game', 'Goals Conceded/Game', 2),
-                        ('total_goals_conceded', 'Total Goals Conceded', 0),
-                        ('xga_per_game', 'xGA/Game', 2),
-                        ('total_xga', 'Total xGA', 2),
-                        ('xga_difference', 'xGA Difference', 2),
-                        ('xga_difference_per_game', 'xGA Difference/Game', 2),
-                        ('clean_sheets', 'Clean Sheets', 0),
-                        ('clean_sheet_pct', 'Clean Sheet %', 1),
-                        ('tackles_per_game', 'Tackles/Game', 2),
-                        ('avg_tackles_won_pct', 'Tackles Won %', 1),
-                        ('interceptions_per_game', 'Interceptions/Game', 2),
-                        ('clearances_per_game', 'Clearances/Game', 2),
-                        ('blocked_shots_per_game', 'Blocked Shots/Game', 2),
-                        ('ball_recoveries_per_game', 'Ball Recoveries/Game', 2),
-                        ('avg_aerial_duels_pct', 'Aerial Duels Won %', 1),
-                        ('avg_ground_duels_pct', 'Ground Duels Won %', 1),
-                        ('saves_per_game', 'Saves/Game', 2)
-                    ]
-                    
-                    # Metrics where lower is better
-                    inverted = ['goals_conceded_per_game', 'total_goals_conceded', 'xga_per_game', 'total_xga']
-                    
-                    defense_df = create_stats_table(
-                        defense_metrics, 
-                        defense_stats, 
-                        league_avg_defense, 
-                        percentiles, 
-                        inverted
-                    )
-                    inverted_names = defense_df.attrs.get('inverted_names', [])
-                    styled_df = defense_df.style.apply(lambda row: style_table(row, inverted_names), axis=1)
-                    st.dataframe(styled_df, width='stretch', height=625, hide_index=True)
-            else:
-                st.warning("No defense statistics available for this team.")
-        
-        except Exception as e:
-            logger.error(f"Error loading defense stats: {e}")
-            st.error(f"Failed to load defense statistics: {e}")
-            st.exception(e)
-
-
-    # ============================================================================
-    # POSSESSION TAB
-    # ============================================================================
-
-    with possession_tab:
-        try:
-            if isinstance(all_teams_possession, pd.DataFrame) and possession_stats:
-                # Calculate percentiles using pre-loaded data
-                league_avg_possession, percentiles = lazy_calculate_league_stats_and_percentiles(
-                    all_teams_possession,  
-                    possession_stats,     
-                    None        
-                )
-
-                # Override with actual league averages using mapped column names
-                mapped_league_avg = map_league_averages(league_averages, 'possession')
-                league_avg_possession.update(mapped_league_avg)
-
-                # Layout with radar and stats table
-                col1, col2 = st.columns([1.2, 1])
-                
-                with col1:
-                    st.markdown("### Possession Radar")
-            
-                    possession_radar_metrics = [
-                        ('avg_possession_pct', 'Possession %'),
-                        ('pass_accuracy_pct', 'Pass Accuracy %'),
-                        ('accurate_passes_per_game', 'Accurate Passes/Game'),
-                        ('accurate_long_balls_per_game', 'Long Balls/Game'),
-                        ('final_third_entries_per_game', 'Final Third Entries/Game'),
-                        ('touches_in_box_per_game', 'Touches In Box/Game'),
-                    ]
-
-                    # Draw radar with PURPLE color scheme
-                    fig = draw_team_radar(
-                        team_stats=possession_stats,
-                        all_teams_df=all_teams_possession,
-                        percentiles=percentiles,
-                        league_avg=league_avg_possession,
-                        team_name=team_name,
-                        metric_config=possession_radar_metrics,
-                        radar_color='#8b5cf6',  # Purple
-                        radar_edge_color='#7c3aed'  # Dark purple
-                    )
-
-                    radar_col1, radar_col2, radar_col3 = st.columns([0.3, 1, 0.3])
-                    with radar_col2:
-                        st.pyplot(fig, width='stretch')
-                    plt.close()
-                    
-                    st.markdown(f"""
-                    <div style="display: flex; justify-content: center; gap: 15px; margin-top: 8px; font-size: 11px;">
-                        <div style="display: flex; align-items: center;">
-                            <div style="width: 14px; height: 14px; background-color: #8b5cf6; margin-right: 5px; border-radius: 2px;"></div>
-                            <span>{team_name}</span>
-                        </div>
-                        <div style="display: flex; align-items: center;">
-                            <div style="width: 14px; height: 14px; background-color: #9ca3af; margin-right: 5px; border-radius: 2px;"></div>
-                            <span>League Average</span>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown("### Possession Statistics")
-                    
-                    possession_metrics = [
-                        ('avg_possession_pct', 'Avg Possession %', 1),
-                        ('pass_accuracy_pct', 'Pass Accuracy %', 1),
-                        ('total_passes_per_game', 'Total Passes/Game', 1),
-                        ('accurate_passes_per_game', 'Accurate Passes/Game', 1),
-                        ('accurate_long_balls_per_game', 'Long Balls/Game', 2),
-                        ('accurate_crosses_per_game', 'Accurate Crosses/Game', 2),
-                        ('final_third_entries_per_game', 'Final Third Entries/Game', 2),
-                        ('touches_in_box_per_game', 'Touches in Box/Game', 2),
-                        ('dispossessed_per_game', 'Dispossessed/Game', 2),
-                        ('total_accurate_passes', 'Total Accurate Passes', 0),
-                        ('total_passes', 'Total Passes', 0)
-                    ]
-                    
-                    inverted = ['dispossessed_per_game']
-                    
-                    possession_df = create_stats_table(
-                        possession_metrics, 
-                        possession_stats, 
-                        league_avg_possession, 
-                        percentiles, 
-                        inverted
-                    )
-                    inverted_names = possession_df.attrs.get('inverted_names', [])
-                    styled_df = possession_df.style.apply(lambda row: style_table(row, inverted_names), axis=1)
-                    st.dataframe(styled_df, width='stretch', height=425, hide_index=True)
-            else:
-                st.warning("No possession statistics available for this team.")
-
-        except Exception as e:
-            logger.error(f"Error loading possession stats: {e}")
-            st.error(f"Failed to load possession statistics: {e}")
-            st.exception(e)
+                render_stat_tab(spec, selected_season_id, team_stats, all_teams_df, league_averages, team_name)
+            except Exception as e:
+                show_error(f"Failed to load {spec.stat_type} statistics", e, detail=show_error_details)
 
     # ============================================================================
     # DISCIPLINE TAB
     # ============================================================================
 
     with discipline_tab:
-        try:
-            if isinstance(all_teams_discipline, pd.DataFrame) and discipline_stats:
-                # Calculate percentiles using pre-loaded data
-                league_avg_discipline, percentiles = lazy_calculate_league_stats_and_percentiles(
-                    all_teams_discipline, 
-                    discipline_stats,       
-                    None       
-                )
-
-                # Override with actual league averages using mapped column names
-                mapped_league_avg = map_league_averages(league_averages, 'discipline')
-                league_avg_discipline.update(mapped_league_avg)
-
-                # Layout with stats table
-                col1 = st.columns([1])
-                
-                with col1[0]:
-                    st.markdown("### Discipline Statistics")
-                    
-                    discipline_metrics = [
-                        ('yellow_cards_per_game', 'Yellow Cards/Game', 2),
-                        ('total_yellow_cards', 'Total Yellow Cards', 0),
-                        ('total_red_cards', 'Red Cards', 0),
-                        ('fouls_per_game', 'Fouls/Game', 2),
-                        ('total_fouls', 'Total Fouls', 0),
-                        ('offsides_per_game', 'Offsides/Game', 2),
-                        ('total_offsides', 'Total Offsides', 0),
-                        ('free_kicks_per_game', 'Free Kicks/Game', 2),
-                        ('total_free_kicks', 'Total Free Kicks', 0)
-                    ]
-                    
-                    # All discipline metrics - lower is better
-                    inverted = [metric[0] for metric in discipline_metrics]
-                    
-                    discipline_df = create_stats_table(
-                        discipline_metrics, 
-                        discipline_stats, 
-                        league_avg_discipline, 
-                        percentiles, 
-                        inverted
+        if discipline_tab.open:
+            try:
+                if discipline_stats:
+                    # No radar on this tab, so league averages and percentiles come
+                    # straight from the database (one row instead of the whole league)
+                    from services.queries import load_team_league_profile
+                    profile = load_team_league_profile(
+                        selected_season_id,
+                        DISCIPLINE_TAB.stat_type,
+                        selected_team_id,
+                        tuple(m[0] for m in DISCIPLINE_TAB.table_metrics)
                     )
-                    inverted_names = discipline_df.attrs.get('inverted_names', [])
-                    styled_df = discipline_df.style.apply(lambda row: style_table(row, inverted_names), axis=1)
-                    st.dataframe(styled_df, width='stretch', height=425, hide_index=True)
-                    
+                    league_avg_discipline = dict(profile['avg'])
+
+                    # Override with actual league averages using mapped column names
+                    league_avg_discipline.update(map_league_averages(league_averages, DISCIPLINE_TAB.stat_type))
+
+                    render_stats_section(
+                        DISCIPLINE_TAB,
+                        MetricArrays.from_stats(
+                            [m[0] for m in DISCIPLINE_TAB.table_metrics],
+                            discipline_stats,
+                            league_avg_discipline,
+                            profile['pct'],
+                        ),
+                    )
+
                     # Fair Play Score
                     st.markdown("### Fair Play Rating")
-                    
-                    total_yellows = safe_get(discipline_stats, 'total_yellow_cards', 0)
-                    total_reds = safe_get(discipline_stats, 'total_red_cards', 0)
+
+                    total_yellows, total_reds = metric_values(discipline_stats, ['total_yellow_cards', 'total_red_cards'])
                     matches_played = safe_get(discipline_stats, 'matches_played', 1)
-                    
-                    fair_play_score = ((total_yellows * 1) + (total_reds * 3)) / matches_played if matches_played > 0 else 0
-                    
-                    if fair_play_score < 2:
-                        fair_play_rating = "Excellent ⭐⭐⭐"
-                        color = "green"
-                    elif fair_play_score < 3:
-                        fair_play_rating = "Good ⭐⭐"
-                        color = "blue"
-                    elif fair_play_score < 4:
-                        fair_play_rating = "Average ⭐"
-                        color = "orange"
-                    else:
-                        fair_play_rating = "Poor ⚠️"
-                        color = "red"
-                    
+                    fair_play_score = (total_yellows + 3 * total_reds) / matches_played if matches_played > 0 else 0
+                    fair_play_rating, color = FAIR_PLAY_RATINGS[bisect(FAIR_PLAY_THRESHOLDS, fair_play_score)]
+
                     col1, col2 = st.columns(2)
                     with col1:
                         render_stat_box("Fair Play Score", f"{fair_play_score:.2f}")
                     with col2:
                         st.markdown(f"**Rating:** :{color}[{fair_play_rating}]")
-                    
+
                     st.caption("Fair Play Score = (Yellow cards × 1 + Red cards × 3) / Matches played")
-            else:
-                st.warning("No discipline statistics available for this team.")
+                else:
+                    st.warning("No discipline statistics available for this team.")
         
-        except Exception as e:
-            logger.error(f"Error loading discipline stats: {e}")
-            st.error(f"Failed to load discipline statistics: {e}")
-            st.exception(e)
+            except Exception as e:
+                show_error("Failed to load discipline statistics", e, detail=show_error_details)
 
     # ============================================================================
     # FOOTER
@@ -1291,6 +1378,16 @@ def teams():
         f"Form window: Last {form_window} matches*"
     )
 
+    # Debug: query cache hits/misses for this session, next to the error details toggle
+    if show_error_details:
+        from services.cache import CacheMonitor
+
+        cache_stats = CacheMonitor().get_stats()
+        st.sidebar.caption(
+            f"Query cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate']:.0f}% hit rate)"
+        )
+
     current_time = time.time() - page_start
     if 'timings' not in st.session_state:
         st.session_state.timings = {}
@@ -6,7 +6,6 @@ Team comparison page based on upcoming fixtures
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 from typing import Optional, Dict, Any, Tuple
 import logging
 import time
@@ -150,6 +149,129 @@ st.markdown("""
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Charts here are read-only, so skip the mode bar DOM on every render
+PLOTLY_CONFIG = {"displayModeBar": False, "responsive": True}
+
+# Parts shared by every scoring gauge; only value/threshold/bar color vary.
+# (Building the Indicator is ~2 ms vs ~18 ms to deepcopy a template Figure,
+# so the shared parts are plain specs rather than a copied figure.)
+GAUGE_AXIS = {'range': [0, 100]}
+GAUGE_STEPS = (
+    {'range': [0, 50], 'color': "#fee2e2"},
+    {'range': [50, 75], 'color': "#fef3c7"},
+    {'range': [75, 100], 'color': "#dcfce7"},
+)
+GAUGE_THRESHOLD_LINE = {'color': "red", 'width': 4}
+
+# Figures depend only on a few rounded numbers, so build each distinct one once
+# and reuse the object across reruns (cache_resource: no pickling of figures)
+@st.cache_resource(max_entries=256, show_spinner=False)
+def scoring_gauge_figure(value: float, threshold: float, bar_color: str, uirevision: str) -> go.Figure:
+    """Scoring probability gauge (value vs the opponent's clean sheet threshold)."""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=value,
+        title={'text': "Scoring Probability"},
+        gauge={
+            'axis': GAUGE_AXIS,
+            'bar': {'color': bar_color},
+            'steps': GAUGE_STEPS,
+            'threshold': {
+                'line': GAUGE_THRESHOLD_LINE,
+                'thickness': 0.75,
+                'value': threshold,
+            },
+        },
+    ))
+    fig.update_layout(height=250, uirevision=uirevision)
+    return fig
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def ppg_bars_figure(home_ppg: float, away_ppg: float, uirevision: str) -> go.Figure:
+    """Home PPG (home games) vs away PPG (away games) bars, colored like the side cards."""
+    fig = go.Figure()
+    for ppg, color in ((home_ppg, "#22c55e"), (away_ppg, "#ef4444")):
+        fig.add_trace(go.Bar(
+            y=[""],
+            x=[ppg],
+            orientation="h",
+            marker=dict(color=color),
+            text=f"{ppg:.2f}",
+            textposition="inside",
+        ))
+    fig.update_layout(
+        showlegend=False,
+        height=150,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis=dict(title="Points Per Game (Current Season)"),
+        uirevision=uirevision,
+    )
+    return fig
+
+# H2H segments in stacking order: (bar color, text font)
+H2H_BAR_STYLES = (("#22c55e", None), ("#eab308", None), ("#ef4444", dict(color="white")))
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def h2h_results_figure(
+    home_wins: int,
+    draws: int,
+    away_wins: int,
+    total_matches: int,
+    home_team_name: str,
+    away_team_name: str,
+    uirevision: str,
+) -> go.Figure:
+    """Stacked 100% H2H bar (home wins | draws | away wins) with count labels underneath."""
+    counts = (home_wins, draws, away_wins)
+    pcts = [count / total_matches * 100 for count in counts]
+    names = (home_team_name, "Draws", away_team_name)
+
+    fig = go.Figure()
+    for pct, name, (color, textfont) in zip(pcts, names, H2H_BAR_STYLES):
+        fig.add_trace(go.Bar(
+            y=["H2H"],
+            x=[pct],
+            orientation="h",
+            marker=dict(color=color),
+            text=[f"<b>{pct:.0f}%</b>"],
+            textposition="inside",
+            insidetextanchor="middle",
+            textfont=textfont,
+            name=name,
+        ))
+
+    fig.update_layout(
+        barmode="stack",
+        showlegend=False,
+        height=230,
+        margin=dict(l=0, r=0, t=70, b=65),
+        xaxis=dict(range=[0, 100], showticklabels=False, showgrid=False, zeroline=False),
+        yaxis=dict(showticklabels=False, showgrid=False, zeroline=False),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        uniformtext=dict(minsize=20, mode="hide"),
+        uirevision=uirevision,
+    )
+
+    fig.add_annotation(
+        x=0.5, y=1.23, xref="paper", yref="paper",
+        text=f"<b>{sum(counts)} Matches</b>",
+        showarrow=False, xanchor="center", yanchor="bottom",
+        font=dict(size=22, color="#111827"),
+    )
+
+    # Count labels under the middle of each segment
+    left = 0.0
+    for pct, label in zip(pcts, (f"{home_wins} Wins", f"{draws} Draws", f"{away_wins} Wins")):
+        fig.add_annotation(
+            x=left + pct / 2, y=-0.14, xref="x", yref="paper",
+            text=f"<b>{label}</b>",
+            showarrow=False, align="center",
+            font=dict(size=15, color="#111827"),
+        )
+        left += pct
+    return fig
+
 def safe_get(data: Optional[Dict[str, Any]], key: str, default: Any = 0) -> Any:
     """Safely get value from dict."""
     if not data:
@@ -157,6 +279,11 @@ def safe_get(data: Optional[Dict[str, Any]], key: str, default: Any = 0) -> Any:
     value = data.get(key, default)
     return default if value is None else value
 
+def safe_values(data: Optional[Dict[str, Any]], keys: list, default: Any = 0) -> list:
+    """safe_get for several keys in one pass (one dict.get per key, no per-key call)."""
+    data = data or {}
+    return [default if (value := data.get(key)) is None else value for key in keys]
+
 def format_percentage(value: Optional[float], decimals: int = 1) -> str:
     if value is None:
         return "NA"
@@ -194,19 +321,24 @@ def parse_form_string(form_string: Optional[str], max_length: int = 5) -> list:
         return []
     return list(form_string[:max_length])
 
+FORM_SPAN_TEMPLATE = (
+    '<span style="display:inline-block; width:30px; height:30px; '
+    'background-color:{color}; color:white; text-align:center; '
+    'line-height:30px; margin:2px; border-radius:4px; '
+    'font-weight:bold; font-size:12px;">{char}</span>'
+)
+UNKNOWN_FORM_COLOR = "#6b7280"
+FORM_HTML = {
+    char: FORM_SPAN_TEMPLATE.format(color=color, char=char)
+    for char, color in [("W", "#22c55e"), ("D", "#eab308"), ("L", "#ef4444")]
+}
+
 def format_form_html(results: list) -> str:
-    """Convert form results to HTML with colored boxes."""
-    colors = {"W": "#22c55e", "D": "#eab308", "L": "#ef4444"}
-    html = ""
-    for result in results:
-        color = colors.get(result, "#6b7280")
-        html += (
-            f'<span style="display:inline-block; width:30px; height:30px; '
-            f'background-color:{color}; color:white; text-align:center; '
-            f'line-height:30px; margin:2px; border-radius:4px; '
-            f'font-weight:bold; font-size:12px;">{result}</span>'
-        )
-    return html
+    """Convert form results to HTML with colored boxes (prebuilt W/D/L spans, one join)."""
+    return "".join(
+        FORM_HTML.get(result) or FORM_SPAN_TEMPLATE.format(color=UNKNOWN_FORM_COLOR, char=result)
+        for result in results
+    )
 
 def _render_form_block(form_data: Dict[str, Any], location: str) -> None:
     overall_results = parse_form_string(safe_get(form_data, "last_results", ""), 5)
@@ -295,29 +427,23 @@ def render_team_card(
 def _overall_stats(overview, attack, defense, btts) -> list[float]:
     matches = safe_get(overview, "matches_played", 1)
     win_pct = safe_get(overview, "wins", 0) / matches * 100 if overview else 0
-    avg_total = safe_get(btts, "overall_avg_goals_per_match", 0)
-    scored = safe_get(attack, "goals_per_game", 0)
-    conceded = safe_get(defense, "goals_conceded_per_game", 0)
-    btts_pct = safe_get(btts, "overall_btts_pct", 0)
-    cs_pct = safe_get(btts, "overall_clean_sheet_pct", 0)
-    home_fts = safe_get(btts, "home_failed_to_score_pct", 0)
-    away_fts = safe_get(btts, "away_failed_to_score_pct", 0)
+    scored, xg = safe_values(attack, ["goals_per_game", "xg_per_game"])
+    conceded, xga = safe_values(defense, ["goals_conceded_per_game", "xga_per_game"])
+    avg_total, btts_pct, cs_pct, home_fts, away_fts = safe_values(btts, [
+        "overall_avg_goals_per_match", "overall_btts_pct", "overall_clean_sheet_pct",
+        "home_failed_to_score_pct", "away_failed_to_score_pct",
+    ])
     fts_pct = (home_fts + away_fts) / 2 if (home_fts or away_fts) else 0
-    xg = safe_get(attack, "xg_per_game", 0)
-    xga = safe_get(defense, "xga_per_game", 0)
     return [win_pct, avg_total, scored, conceded, btts_pct, cs_pct, fts_pct, xg, xga]
 
+# Per-location (home/away) BTTS columns, in stats table row order
+_LOCATION_STAT_FIELDS = [
+    "win_pct", "avg_goals_per_match", "avg_scored", "avg_conceded",
+    "btts_pct", "clean_sheet_pct", "failed_to_score_pct", "avg_xg", "avg_xga",
+]
+
 def _location_stats(btts: Dict[str, Any], prefix: str) -> list[float]:
-    win_pct = safe_get(btts, f"{prefix}_win_pct", 0)
-    avg_total = safe_get(btts, f"{prefix}_avg_goals_per_match", 0)
-    scored = safe_get(btts, f"{prefix}_avg_scored", 0)
-    conceded = safe_get(btts, f"{prefix}_avg_conceded", 0)
-    btts_pct = safe_get(btts, f"{prefix}_btts_pct", 0)
-    cs_pct = safe_get(btts, f"{prefix}_clean_sheet_pct", 0)
-    fts_pct = safe_get(btts, f"{prefix}_failed_to_score_pct", 0)
-    xg = safe_get(btts, f"{prefix}_avg_xg", 0)
-    xga = safe_get(btts, f"{prefix}_avg_xga", 0)
-    return [win_pct, avg_total, scored, conceded, btts_pct, cs_pct, fts_pct, xg, xga]
+    return safe_values(btts, [f"{prefix}_{field}" for field in _LOCATION_STAT_FIELDS])
 
 def _current_values(
     overview, attack, defense, btts_data, location_key: str
@@ -330,19 +456,7 @@ def _current_values(
 def _comparison_values_overall(
     comp_overview, comp_attack, comp_defense, comp_btts,
 ) -> list[float]:
-    matches = safe_get(comp_overview, "matches_played", 1)
-    win_pct = safe_get(comp_overview, "wins", 0) / matches * 100 if comp_overview else 0
-    avg_total = safe_get(comp_btts, "overall_avg_goals_per_match", 0)
-    scored = safe_get(comp_attack, "goals_per_game", 0)
-    conceded = safe_get(comp_defense, "goals_conceded_per_game", 0)
-    btts_pct = safe_get(comp_btts, "overall_btts_pct", 0)
-    cs_pct = safe_get(comp_btts, "overall_clean_sheet_pct", 0)
-    home_fts = safe_get(comp_btts, "home_failed_to_score_pct", 0)
-    away_fts = safe_get(comp_btts, "away_failed_to_score_pct", 0)
-    fts_pct = (home_fts + away_fts) / 2 if (home_fts or away_fts) else 0
-    xg = safe_get(comp_attack, "xg_per_game", 0)
-    xga = safe_get(comp_defense, "xga_per_game", 0)
-    return [win_pct, avg_total, scored, conceded, btts_pct, cs_pct, fts_pct, xg, xga]
+    return _overall_stats(comp_overview, comp_attack, comp_defense, comp_btts)
 
 def _comparison_values_location(
     comp_btts: Dict[str, Any], comp_key: str
@@ -371,13 +485,14 @@ def _format_stat_value(stat_name: str, value: float) -> str:
         return format_percentage(value, decimals=2)
     return format_number(value, 2)
 
-def _colorize_value(
-    stat_name: str,
+def _highlight_comparison(
+    formatted_val: str,
     current_val: float,
     comp_val: Optional[float],
-    reverse_stats: set[str],
+    lower_is_better: bool = False,
+    threshold: float = 0.1,
 ) -> str:
-    formatted_val = _format_stat_value(stat_name, current_val)
+    """Wrap a formatted value in green/red when it beats/trails the other side by more than threshold."""
     if comp_val is None:
         return formatted_val
 
@@ -385,17 +500,52 @@ def _colorize_value(
     if current_val == comp_val:
         return formatted_val
 
-    is_better = current_val < comp_val if stat_name in reverse_stats else current_val > comp_val
-    diff = abs(current_val - comp_val)
-    threshold = 0.1 if stat_name.endswith("%") else 0.01
-
     # below or equal to threshold → no color
-    if diff <= threshold:
+    if abs(current_val - comp_val) <= threshold:
         return formatted_val
 
+    is_better = current_val < comp_val if lower_is_better else current_val > comp_val
     color = "#22c55e" if is_better else "#ef4444"
     return f'<span style="color: {color}; font-weight: bold;">{formatted_val}</span>'
 
+def _colorize_value(
+    stat_name: str,
+    current_val: float,
+    comp_val: Optional[float],
+    reverse_stats: set[str],
+) -> str:
+    return _highlight_comparison(
+        _format_stat_value(stat_name, current_val),
+        current_val,
+        comp_val,
+        lower_is_better=stat_name in reverse_stats,
+        threshold=0.1 if stat_name.endswith("%") else 0.01,
+    )
+
+# Shared look of the Compare tables (same markup pandas' to_html produced)
+COMPARE_TABLE_STYLE = """<style>
+table { width: 100%; border-collapse: collapse; }
+th { background-color: #f0f2f6; padding: 8px; text-align: left; font-weight: 600; border-bottom: 2px solid #e0e0e0; }
+td { padding: 8px; border-bottom: 1px solid #e0e0e0; text-align: left; }
+</style>"""
+
+def _html_table(headers: list, rows) -> str:
+    """
+    Build a small static HTML table from ready cell strings (HTML not escaped).
+    
+    Cheaper than a throwaway DataFrame + to_html for these few-row tables.
+    """
+    head = ''.join(f'<th>{header}</th>' for header in headers)
+    body = ''.join(
+        '<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>'
+        for row in rows
+    )
+    return (
+        f'<div style="width: 100%;">{COMPARE_TABLE_STYLE}'
+        f'<table border="1" class="dataframe"><thead><tr style="text-align: right;">{head}</tr></thead>'
+        f'<tbody>{body}</tbody></table></div>'
+    )
+
 def render_stats_table(
     overview,
     attack,
@@ -429,36 +579,7 @@ def render_stats_table(
     ]
 
     # build and render the table
-    data = {
-        "Stat": stat_names,
-        "Value": formatted_values,
-    }
-    df = pd.DataFrame(data)
-
-    table_html = df.to_html(escape=False, index=False)
-    styled_table = f"""
-    <div style="width: 100%;">
-        <style>
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-            }}
-            th {{
-                background-color: #f0f2f6;
-                padding: 8px;
-                text-align: left;
-                font-weight: 600;
-                border-bottom: 2px solid #e0e0e0;
-            }}
-            td {{
-                padding: 8px;
-                border-bottom: 1px solid #e0e0e0;
-            }}
-        </style>
-        {table_html}
-    </div>
-    """
-    st.markdown(styled_table, unsafe_allow_html=True)
+    st.markdown(_html_table(["Stat", "Value"], zip(stat_names, formatted_values)), unsafe_allow_html=True)
 
 def render_scored_table(home_team_name: str,
                         away_team_name: str,
@@ -467,79 +588,33 @@ def render_scored_table(home_team_name: str,
     """Home (home_*) vs Away (away_*) scoring profile with colored comparison."""
     metrics = ['Over 0.5', 'Over 1.5', 'Over 2.5', 'Over 3.5', 'Failed to Score']
 
-    home_vals = [
-        safe_get(home_btts, 'home_scored_over_05_pct', 0),
-        safe_get(home_btts, 'home_scored_over_15_pct', 0),
-        safe_get(home_btts, 'home_scored_over_25_pct', 0),
-        safe_get(home_btts, 'home_scored_over_35_pct', 0),
-        safe_get(home_btts, 'home_failed_to_score_pct', 0),
-    ]
-    away_vals = [
-        safe_get(away_btts, 'away_scored_over_05_pct', 0),
-        safe_get(away_btts, 'away_scored_over_15_pct', 0),
-        safe_get(away_btts, 'away_scored_over_25_pct', 0),
-        safe_get(away_btts, 'away_scored_over_35_pct', 0),
-        safe_get(away_btts, 'away_failed_to_score_pct', 0),
-    ]
-
-    def format_cell(val: float) -> str:
-        return format_percentage(val, 2)
-
-    def color_cell(metric: str, cur: float, other: float) -> str:
-        base = format_cell(cur)
-        if other is None:
-            return base
-        if cur == other:
-            return base
-
-        # For "Failed to Score", lower is better; otherwise higher is better
-        reverse = (metric == 'Failed to Score')
-        is_better = cur < other if reverse else cur > other
-        diff = abs(cur - other)
-        threshold = 0.1  # % points
-
-        if diff <= threshold:
-            return base
-
-        color = "#22c55e" if is_better else "#ef4444"
-        return f'<span style="color:{color}; font-weight:bold;">{base}</span>'
+    home_vals = safe_values(home_btts, [
+        "home_scored_over_05_pct",
+        "home_scored_over_15_pct",
+        "home_scored_over_25_pct",
+        "home_scored_over_35_pct",
+        "home_failed_to_score_pct",
+    ])
+    away_vals = safe_values(away_btts, [
+        "away_scored_over_05_pct",
+        "away_scored_over_15_pct",
+        "away_scored_over_25_pct",
+        "away_scored_over_35_pct",
+        "away_failed_to_score_pct",
+    ])
 
     rows = []
     for m, hv, av in zip(metrics, home_vals, away_vals):
-        h_html = color_cell(m, hv, av)
-        a_html = color_cell(m, av, hv)
-        rows.append({
-            "Metric": m,
-            f"{home_team_name} (Home)": h_html,
-            f"{away_team_name} (Away)": a_html,
-        })
-
-    df = pd.DataFrame(rows)
-    table_html = df.to_html(escape=False, index=False)
-    styled = f"""
-    <div style="width: 100%;">
-        <style>
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-            }}
-            th {{
-                background-color: #f0f2f6;
-                padding: 8px;
-                text-align: left !important;
-                font-weight: 600;
-                border-bottom: 2px solid #e0e0e0;
-            }}
-            td {{
-                padding: 8px;
-                border-bottom: 1px solid #e0e0e0;
-                text-align: left;
-            }}
-        </style>
-        {table_html}
-    </div>
-    """
-    st.markdown(styled, unsafe_allow_html=True)
+        # For "Failed to Score", lower is better; otherwise higher is better
+        reverse = (m == 'Failed to Score')
+        h_html = _highlight_comparison(format_percentage(hv, 2), hv, av, reverse)
+        a_html = _highlight_comparison(format_percentage(av, 2), av, hv, reverse)
+        rows.append((m, h_html, a_html))
+
+    st.markdown(
+        _html_table(["Metric", f"{home_team_name} (Home)", f"{away_team_name} (Away)"], rows),
+        unsafe_allow_html=True,
+    )
 
 def render_conceded_table(home_team_name: str,
                           away_team_name: str,
@@ -548,78 +623,33 @@ def render_conceded_table(home_team_name: str,
     """Home (home_*) vs Away (away_*) defensive profile with colored comparison."""
     metrics = ['Over 0.5', 'Over 1.5', 'Over 2.5', 'Over 3.5', 'Clean Sheets']
 
-    home_vals = [
-        safe_get(home_btts, 'home_conceded_over_05_pct', 0),
-        safe_get(home_btts, 'home_conceded_over_15_pct', 0),
-        safe_get(home_btts, 'home_conceded_over_25_pct', 0),
-        safe_get(home_btts, 'home_conceded_over_35_pct', 0),
-        safe_get(home_btts, 'home_clean_sheet_pct', 0),
-    ]
-    away_vals = [
-        safe_get(away_btts, 'away_conceded_over_05_pct', 0),
-        safe_get(away_btts, 'away_conceded_over_15_pct', 0),
-        safe_get(away_btts, 'away_conceded_over_25_pct', 0),
-        safe_get(away_btts, 'away_conceded_over_35_pct', 0),
-        safe_get(away_btts, 'away_clean_sheet_pct', 0),
-    ]
-
-    def format_cell(val: float) -> str:
-        return format_percentage(val, 2)
-
-    def color_cell(metric: str, cur: float, other: float) -> str:
-        base = format_cell(cur)
-        if other is None:
-            return base
-        if cur == other:
-            return base
-
-        # For "Over X.5" conceded, lower is better; for "Clean Sheets", higher is better
-        reverse = metric.startswith("Over ")
-        is_better = cur < other if reverse else cur > other
-        diff = abs(cur - other)
-        threshold = 0.1  # % points
-
-        if diff <= threshold:
-            return base
-
-        color = "#22c55e" if is_better else "#ef4444"
-        return f'<span style="color:{color}; font-weight:bold;">{base}</span>'
+    home_vals = safe_values(home_btts, [
+        "home_conceded_over_05_pct",
+        "home_conceded_over_15_pct",
+        "home_conceded_over_25_pct",
+        "home_conceded_over_35_pct",
+        "home_clean_sheet_pct",
+    ])
+    away_vals = safe_values(away_btts, [
+        "away_conceded_over_05_pct",
+        "away_conceded_over_15_pct",
+        "away_conceded_over_25_pct",
+        "away_conceded_over_35_pct",
+        "away_clean_sheet_pct",
+    ])
 
     rows = []
     for m, hv, av in zip(metrics, home_vals, away_vals):
-        h_html = color_cell(m, hv, av)
-        a_html = color_cell(m, av, hv)
-        rows.append({
-            "Metric": m,
-            f"{home_team_name} (Home)": h_html,
-            f"{away_team_name} (Away)": a_html,
-        })
-
-    df = pd.DataFrame(rows)
-    table_html = df.to_html(escape=False, index=False)
-    styled = f"""
-    <div style="width: 100%;">
-        <style>
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-            }}
-            th {{
-                background-color: #f0f2f6;
-                padding: 8px;
-                text-align: left;
-                font-weight: 600;
-                border-bottom: 2px solid #e0e0e0;
-            }}
-            td {{
-                padding: 8px;
-                border-bottom: 1px solid #e0e0e0;
-            }}
-        </style>
-        {table_html}
-    </div>
-    """
-    st.markdown(styled, unsafe_allow_html=True)
+        # For "Over X.5" conceded, lower is better; for "Clean Sheets", higher is better
+        reverse = m.startswith("Over ")
+        h_html = _highlight_comparison(format_percentage(hv, 2), hv, av, reverse)
+        a_html = _highlight_comparison(format_percentage(av, 2), av, hv, reverse)
+        rows.append((m, h_html, a_html))
+
+    st.markdown(
+        _html_table(["Metric", f"{home_team_name} (Home)", f"{away_team_name} (Away)"], rows),
+        unsafe_allow_html=True,
+    )
 
 def render_halves_scored_table(home_team_name: str,
                                away_team_name: str,
@@ -634,81 +664,36 @@ def render_halves_scored_table(home_team_name: str,
         "Avg 2H Goals",
     ]
 
-    home_vals = [
-        safe_get(home_season, "home_scored_1h_pct", 0),
-        safe_get(home_season, "home_scored_2h_pct", 0),
-        safe_get(home_season, "home_scored_both_halves_pct", 0),
-        safe_get(home_season, "home_avg_goals_1h", 0),
-        safe_get(home_season, "home_avg_goals_2h", 0),
-    ]
-    away_vals = [
-        safe_get(away_season, "away_scored_1h_pct", 0),
-        safe_get(away_season, "away_scored_2h_pct", 0),
-        safe_get(away_season, "away_scored_both_halves_pct", 0),
-        safe_get(away_season, "away_avg_goals_1h", 0),
-        safe_get(away_season, "away_avg_goals_2h", 0),
-    ]
-
-    def is_percent(metric: str) -> bool:
-        return metric.startswith("Scored") or metric == "Both Halves"
-
-    def format_cell(val: float, pct: bool) -> str:
-        return format_percentage(val, 2) if pct else format_number(val, 2)
-
-    def color_cell(metric: str, cur: float, other: float) -> str:
-        pct = is_percent(metric)
-        base = format_cell(cur, pct)
-        if other is None:
-            return base
-        if cur == other:
-            return base
-
-        # For scoring, higher is always better
-        is_better = cur > other
-        diff = abs(cur - other)
-        threshold = 0.1 if pct else 0.01
-
-        if diff <= threshold:
-            return base
-
-        color = "#22c55e" if is_better else "#ef4444"
-        return f'<span style="color:{color}; font-weight:bold;">{base}</span>'
+    home_vals = safe_values(home_season, [
+        "home_scored_1h_pct",
+        "home_scored_2h_pct",
+        "home_scored_both_halves_pct",
+        "home_avg_goals_1h",
+        "home_avg_goals_2h",
+    ])
+    away_vals = safe_values(away_season, [
+        "away_scored_1h_pct",
+        "away_scored_2h_pct",
+        "away_scored_both_halves_pct",
+        "away_avg_goals_1h",
+        "away_avg_goals_2h",
+    ])
 
     rows = []
     for m, hv, av in zip(metrics, home_vals, away_vals):
-        h_html = color_cell(m, hv, av)
-        a_html = color_cell(m, av, hv)
-        rows.append({
-            "Metric": m,
-            f"{home_team_name} (Home)": h_html,
-            f"{away_team_name} (Away)": a_html,
-        })
-
-    df = pd.DataFrame(rows)
-    table_html = df.to_html(escape=False, index=False)
-    styled = f"""
-    <div style="width: 100%;">
-        <style>
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-            }}
-            th {{
-                background-color: #f0f2f6;
-                padding: 8px;
-                text-align: left;
-                font-weight: 600;
-                border-bottom: 2px solid #e0e0e0;
-            }}
-            td {{
-                padding: 8px;
-                border-bottom: 1px solid #e0e0e0;
-            }}
-        </style>
-        {table_html}
-    </div>
-    """
-    st.markdown(styled, unsafe_allow_html=True)
+        pct = m.startswith("Scored") or m == "Both Halves"
+        fmt = format_percentage if pct else format_number
+        threshold = 0.1 if pct else 0.01
+        # For scoring, higher is always better
+        reverse = False
+        h_html = _highlight_comparison(fmt(hv, 2), hv, av, reverse, threshold)
+        a_html = _highlight_comparison(fmt(av, 2), av, hv, reverse, threshold)
+        rows.append((m, h_html, a_html))
+
+    st.markdown(
+        _html_table(["Metric", f"{home_team_name} (Home)", f"{away_team_name} (Away)"], rows),
+        unsafe_allow_html=True,
+    )
 
 def render_halves_conceded_table(home_team_name: str,
                                  away_team_name: str,
@@ -722,81 +707,34 @@ def render_halves_conceded_table(home_team_name: str,
         "Avg 2H Conceded",
     ]
 
-    home_vals = [
-        safe_get(home_season, "home_clean_sheet_1h_pct", 0),
-        safe_get(home_season, "home_clean_sheet_2h_pct", 0),
-        safe_get(home_season, "home_avg_conceded_1h", 0),
-        safe_get(home_season, "home_avg_conceded_2h", 0),
-    ]
-    away_vals = [
-        safe_get(away_season, "away_clean_sheet_1h_pct", 0),
-        safe_get(away_season, "away_clean_sheet_2h_pct", 0),
-        safe_get(away_season, "away_avg_conceded_1h", 0),
-        safe_get(away_season, "away_avg_conceded_2h", 0),
-    ]
-
-    def is_percent(metric: str) -> bool:
-        return "Clean Sheet" in metric
-
-    def format_cell(val: float, pct: bool) -> str:
-        return format_percentage(val, 2) if pct else format_number(val, 2)
-
-    def color_cell(metric: str, cur: float, other: float) -> str:
-        pct = is_percent(metric)
-        base = format_cell(cur, pct)
-        if other is None:
-            return base
-        if cur == other:
-            return base
-
-        # For clean sheets, higher is better; for Avg Conceded, lower is better
-        reverse = metric.startswith("Avg ")
-        is_better = cur < other if reverse else cur > other
-
-        diff = abs(cur - other)
-        threshold = 0.1 if pct else 0.01
-
-        if diff <= threshold:
-            return base
-
-        color = "#22c55e" if is_better else "#ef4444"
-        return f'<span style="color:{color}; font-weight:bold;">{base}</span>'
+    home_vals = safe_values(home_season, [
+        "home_clean_sheet_1h_pct",
+        "home_clean_sheet_2h_pct",
+        "home_avg_conceded_1h",
+        "home_avg_conceded_2h",
+    ])
+    away_vals = safe_values(away_season, [
+        "away_clean_sheet_1h_pct",
+        "away_clean_sheet_2h_pct",
+        "away_avg_conceded_1h",
+        "away_avg_conceded_2h",
+    ])
 
     rows = []
     for m, hv, av in zip(metrics, home_vals, away_vals):
-        h_html = color_cell(m, hv, av)
-        a_html = color_cell(m, av, hv)
-        rows.append({
-            "Metric": m,
-            f"{home_team_name} (Home)": h_html,
-            f"{away_team_name} (Away)": a_html,
-        })
-
-    df = pd.DataFrame(rows)
-    table_html = df.to_html(escape=False, index=False)
-    styled = f"""
-    <div style="width: 100%;">
-        <style>
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-            }}
-            th {{
-                background-color: #f0f2f6;
-                padding: 8px;
-                text-align: left;
-                font-weight: 600;
-                border-bottom: 2px solid #e0e0e0;
-            }}
-            td {{
-                padding: 8px;
-                border-bottom: 1px solid #e0e0e0;
-            }}
-        </style>
-        {table_html}
-    </div>
-    """
-    st.markdown(styled, unsafe_allow_html=True)
+        pct = "Clean Sheet" in m
+        fmt = format_percentage if pct else format_number
+        threshold = 0.1 if pct else 0.01
+        # For clean sheets, higher is better; for Avg Conceded, lower is better
+        reverse = m.startswith("Avg ")
+        h_html = _highlight_comparison(fmt(hv, 2), hv, av, reverse, threshold)
+        a_html = _highlight_comparison(fmt(av, 2), av, hv, reverse, threshold)
+        rows.append((m, h_html, a_html))
+
+    st.markdown(
+        _html_table(["Metric", f"{home_team_name} (Home)", f"{away_team_name} (Away)"], rows),
+        unsafe_allow_html=True,
+    )
 
 
 @time_page_load
@@ -816,6 +754,10 @@ def compare():
 
     with st.sidebar:
         st.header("Select Fixture")
+
+        from components.errors import error_details_toggle, show_error
+
+        show_error_details = error_details_toggle()
         
         # Get active season from session state (set in Home page) or fallback to config
         from services.queries import get_active_season_from_config
@@ -874,9 +816,7 @@ def compare():
             match_date = match_data['match_date']
             
         except Exception as e:
-            logger.error(f"Error loading fixtures: {e}")
-            st.error(f"Failed to load fixtures: {e}")
-            st.exception(e)
+            show_error("Failed to load fixtures", e, detail=show_error_details)
             st.stop()
 
 
@@ -887,27 +827,30 @@ def compare():
     try:
         from services.queries import get_head_to_head
         from services.queries import get_all_team_stats
-        from services.queries import get_btts_analysis
+        from services.queries import btts_analysis_from_row
         from services.queries import get_team_form
         from services.queries import get_league_standings
-
-        # Get head-to-head data
-        h2h_data = get_head_to_head(home_team_id, away_team_id)
-        
-        # Get all stats for both teams
-        home_stats = get_all_team_stats(home_team_id, season_id)
-        away_stats = get_all_team_stats(away_team_id, season_id)
-        
-        # Get BTTS analysis
-        home_btts = get_btts_analysis(home_team_id, season_id)
-        away_btts = get_btts_analysis(away_team_id, season_id)
+        from services.cache import load_concurrently
+
+        # The loads are independent, so cold ones overlap their DB round trips
+        (
+            h2h_data,                   # Head-to-head data
+            home_stats, away_stats,     # All stats for both teams
+            home_form_5, away_form_5,   # Team forms (last 5)
+            standings_df,               # League standings for position
+        ) = load_concurrently(
+            (get_head_to_head, (home_team_id, away_team_id)),
+            (get_all_team_stats, (home_team_id, season_id)),
+            (get_all_team_stats, (away_team_id, season_id)),
+            (get_team_form, (home_team_id, 5)),
+            (get_team_form, (away_team_id, 5)),
+            (get_league_standings, (season_id,)),
+        )
         
-        # Get team forms (last 5, 10, 15, 20)
-        home_form_5 = get_team_form(home_team_id, 5)
-        away_form_5 = get_team_form(away_team_id, 5)
+        # BTTS analysis: the btts row already came back with the team stats
+        home_btts = btts_analysis_from_row(home_stats.get('btts', {}))
+        away_btts = btts_analysis_from_row(away_stats.get('btts', {}))
         
-        # Get league standings for position
-        standings_df = get_league_standings(season_id)
         home_position = standings_df[standings_df['team_id'] == home_team_id].index[0] + 1 if not standings_df.empty else "N/A"
         away_position = standings_df[standings_df['team_id'] == away_team_id].index[0] + 1 if not standings_df.empty else "N/A"
         total_teams = len(standings_df)
@@ -947,23 +890,6 @@ def compare():
             draws = h2h_data['draws']
             total_matches = h2h_data['total_matches']
             
-            # Win percentages
-            home_win_pct = (home_wins / total_matches) * 100
-            draw_pct = (draws / total_matches) * 100
-            away_win_pct = (away_wins / total_matches) * 100
-            
-            # --- Visual bar (H2H) ---
-
-            # --- normalize to 100 ---
-            total_pct = home_win_pct + draw_pct + away_win_pct
-            if total_pct > 0:
-                s = 100.0 / total_pct
-                hw, dr, aw = home_win_pct * s, draw_pct * s, away_win_pct * s
-            else:
-                hw = dr = aw = 0.0
-
-            total_matches = home_wins + draws + away_wins
-
             # ---------- Single row: home | center(date+bar) | away ----------
             left_col, center_col, right_col = st.columns(
                 [1, 2, 1],
@@ -1010,83 +936,15 @@ def compare():
                 )
 
                 # Visual bar (rectangle, no rounding)
-                fig = go.Figure()
-
-                fig.add_trace(go.Bar(
-                    y=["H2H"],
-                    x=[home_win_pct],
-                    orientation="h",
-                    marker=dict(color="#22c55e"),
-                    text=[f"<b>{home_win_pct:.0f}%</b>"],
-                    textposition="inside",
-                    insidetextanchor="middle",
-                    name=home_team_name,
-                ))
-                fig.add_trace(go.Bar(
-                    y=["H2H"],
-                    x=[draw_pct],
-                    orientation="h",
-                    marker=dict(color="#eab308"),
-                    text=[f"<b>{draw_pct:.0f}%</b>"],
-                    textposition="inside",
-                    insidetextanchor="middle",
-                    name="Draws",
-                ))
-                fig.add_trace(go.Bar(
-                    y=["H2H"],
-                    x=[away_win_pct],
-                    orientation="h",
-                    marker=dict(color="#ef4444"),
-                    text=[f"<b>{away_win_pct:.0f}%</b>"],
-                    textposition="inside",
-                    insidetextanchor="middle",
-                    textfont=dict(color="white"),
-                    name=away_team_name,
-                ))
-
-                fig.update_layout(
-                    barmode="stack",
-                    showlegend=False,
-                    height=230,
-                    margin=dict(l=0, r=0, t=70, b=65),
-                    xaxis=dict(range=[0, 100], showticklabels=False, showgrid=False, zeroline=False),
-                    yaxis=dict(showticklabels=False, showgrid=False, zeroline=False),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    uniformtext=dict(minsize=20, mode="hide"),
-                )
-
-                fig.add_annotation(
-                    x=0.5, y=1.23, xref="paper", yref="paper",
-                    text=f"<b>{total_matches} Matches</b>",
-                    showarrow=False, xanchor="center", yanchor="bottom",
-                    font=dict(size=22, color="#111827"),
+                fig = h2h_results_figure(
+                    home_wins, draws, away_wins, total_matches,
+                    home_team_name, away_team_name,
+                    f"{home_team_id}-{away_team_id}",
                 )
 
-                mid_home = home_win_pct / 2
-                mid_draw = home_win_pct + draw_pct / 2
-                mid_away = home_win_pct + draw_pct + away_win_pct / 2
-
-                fig.add_annotation(
-                    x=mid_home, y=-0.14, xref="x", yref="paper",
-                    text=f"<b>{home_wins} Wins</b>",
-                    showarrow=False, align="center",
-                    font=dict(size=15, color="#111827"),
-                )
-                fig.add_annotation(
-                    x=mid_draw, y=-0.14, xref="x", yref="paper",
-                    text=f"<b>{draws} Draws</b>",
-                    showarrow=False, align="center",
-                    font=dict(size=15, color="#111827"),
-                )
-                fig.add_annotation(
-                    x=mid_away, y=-0.14, xref="x", yref="paper",
-                    text=f"<b>{away_wins} Wins</b>",
-                    showarrow=False, align="center",
-                    font=dict(size=15, color="#111827"),
-                )
-
-                st.plotly_chart(fig, width="stretch", config={"displayModeBar": False})
+                # Stable keys let the browser update charts in place (Plotly.react)
+                # when another fixture is selected, instead of re-mounting them
+                st.plotly_chart(fig, width="stretch", config=PLOTLY_CONFIG, key="h2h_results_chart")
 
                         
             # Statistics grid
@@ -1322,33 +1180,12 @@ def compare():
             )
 
             # central PPG bars – keep same colors as side cards
-            max_ppg = max(home_ppg_home, away_ppg_away, 3.0)
-
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                y=[f""],
-                x=[home_ppg_home],
-                orientation="h",
-                marker=dict(color="#22c55e"),  # same as home side card border
-                text=f"{home_ppg_home:.2f}",
-                textposition="inside",
-            ))
-            fig.add_trace(go.Bar(
-                y=[f""],
-                x=[away_ppg_away],
-                orientation="h",
-                marker=dict(color="#ef4444"),  # same as away side card border
-                text=f"{away_ppg_away:.2f}",
-                textposition="inside",
-            ))
-
-            fig.update_layout(
-                showlegend=False,
-                height=150,
-                margin=dict(l=0, r=0, t=0, b=0),
-                xaxis=dict(title="Points Per Game (Current Season)"),
+            fig = ppg_bars_figure(
+                round(float(home_ppg_home), 2),
+                round(float(away_ppg_away), 2),
+                f"{home_team_id}-{away_team_id}",
             )
-            st.plotly_chart(fig, width='stretch')
+            st.plotly_chart(fig, width='stretch', config=PLOTLY_CONFIG, key="ppg_comparison_chart")
 
         with col3:
             away_block = f"""
@@ -1543,27 +1380,13 @@ def compare():
             )
 
             # Gauge
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=home_scored_pct,
-                title={'text': "Scoring Probability"},
-                gauge={
-                    'axis': {'range': [0, 100]},
-                    'bar': {'color': "#22c55e"},
-                    'steps': [
-                        {'range': [0, 50], 'color': "#fee2e2"},
-                        {'range': [50, 75], 'color': "#fef3c7"},
-                        {'range': [75, 100], 'color': "#dcfce7"},
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': away_cs_pct,
-                    },
-                },
-            ))
-            fig.update_layout(height=250)
-            st.plotly_chart(fig, width='stretch')
+            fig = scoring_gauge_figure(
+                round(float(home_scored_pct), 1),
+                round(float(away_cs_pct), 1),
+                "#22c55e",
+                f"{home_team_id}-{away_team_id}",
+            )
+            st.plotly_chart(fig, width='stretch', config=PLOTLY_CONFIG, key="home_scoring_gauge")
 
         # ---------------- Away block ----------------
         with col2:
@@ -1596,27 +1419,14 @@ def compare():
                 unsafe_allow_html=True,
             )
 
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=away_scored_pct,
-                title={'text': "Scoring Probability"},
-                gauge={
-                    'axis': {'range': [0, 100]},
-                    'bar': {'color': "#ef4444"},
-                    'steps': [
-                        {'range': [0, 50], 'color': "#fee2e2"},
-                        {'range': [50, 75], 'color': "#fef3c7"},
-                        {'range': [75, 100], 'color': "#dcfce7"},
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': home_cs_pct,
-                    },
-                },
-            ))
-            fig.update_layout(height=250)
-            st.plotly_chart(fig, width='stretch')
+            # Gauge
+            fig = scoring_gauge_figure(
+                round(float(away_scored_pct), 1),
+                round(float(home_cs_pct), 1),
+                "#ef4444",
+                f"{home_team_id}-{away_team_id}",
+            )
+            st.plotly_chart(fig, width='stretch', config=PLOTLY_CONFIG, key="away_scoring_gauge")
 
     st.markdown("---")
     st.caption(f"*Data from current season - {home_team_name} (Home) vs {away_team_name} (Away)*")
@@ -4,13 +4,14 @@ Implements cache decorators, monitoring, and management.
 """
 import streamlit as st
 from functools import wraps
-from typing import Any, Callable, Optional, Dict
+from typing import Any, Callable, Optional, Dict, List, Tuple
 from datetime import datetime
 import logging
 import hashlib
 import json
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +79,20 @@ def cache_query_result(ttl: int = 600):
     return cache_with_monitoring(type='data', ttl=ttl)
 
 
+def cache_shared_result(ttl: int = 600):
+    """
+    Decorator for caching large, read-only query results without copying.
+    
+    Backed by st.cache_resource, so every caller gets the same object instead
+    of a freshly deserialized copy. Callers must .copy() before mutating.
+    Cleared by CacheManager.clear_resource_cache(), not clear_query_cache().
+    
+    Args:
+        ttl: Time to live in seconds (default: 600 = 10 minutes)
+    """
+    return cache_with_monitoring(type='resource', ttl=ttl)
+
+
 # ============================================================================
 # Cache Management
 # ============================================================================
@@ -149,8 +164,9 @@ class CacheWarmer:
             get_all_seasons,
             get_upcoming_fixtures,
             get_league_standings,
-            get_bulk_league_stats
+            load_league_stats
         )
+        from config.team_metrics import LEAGUE_STAT_COLUMNS
         
         try:
             logger.info("Starting cache warm-up...")
@@ -163,13 +179,14 @@ class CacheWarmer:
             # Warm league standings and stats
             if season_id:
                 get_league_standings(season_id)
-                get_bulk_league_stats(season_id)
+                # Same columns (and so the same cache entry) as the Teams page
+                load_league_stats(int(season_id), LEAGUE_STAT_COLUMNS)
             
             # Warm upcoming fixtures and its team data to speed up Compare page
             fixtures_df = get_upcoming_fixtures(season_id=season_id, limit=20)
             if not fixtures_df.empty:
                 # Warm first 5 fixtures specifically for Compare page
-                from services.queries import get_all_team_stats, get_btts_analysis, get_team_form, get_head_to_head
+                from services.queries import get_all_team_stats, get_team_form, get_head_to_head
                 
                 # Deduplicate team IDs
                 teams_to_warm = set()
@@ -181,8 +198,7 @@ class CacheWarmer:
                     h2h_to_warm.append((row['home_team_id'], row['away_team_id']))
                 
                 for tid in teams_to_warm:
-                    get_all_team_stats(tid, season_id)
-                    get_btts_analysis(tid, season_id)
+                    get_all_team_stats(tid, season_id)  # includes the BTTS row
                     get_team_form(tid, 5)
                 
                 for t1, t2 in h2h_to_warm:
@@ -201,6 +217,8 @@ class CacheMonitor:
     """Monitor cache performance and statistics."""
     
     _stats_key = "_cache_stats"
+    # load_concurrently workers record into the same session's counters
+    _lock = threading.Lock()
     
     def __init__(self):
         """Initialize cache monitor with session state."""
@@ -214,15 +232,18 @@ class CacheMonitor:
     
     def record_hit(self):
         """Record a cache hit."""
-        st.session_state[self._stats_key]['hits'] += 1
+        with self._lock:
+            st.session_state[self._stats_key]['hits'] += 1
     
     def record_miss(self):
         """Record a cache miss."""
-        st.session_state[self._stats_key]['misses'] += 1
+        with self._lock:
+            st.session_state[self._stats_key]['misses'] += 1
     
     def record_error(self):
         """Record a cache error."""
-        st.session_state[self._stats_key]['errors'] += 1
+        with self._lock:
+            st.session_state[self._stats_key]['errors'] += 1
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -245,12 +266,13 @@ class CacheMonitor:
     
     def reset_stats(self):
         """Reset cache statistics."""
-        st.session_state[self._stats_key] = {
-            'hits': 0,
-            'misses': 0,
-            'errors': 0,
-            'last_reset': datetime.now()
-        }
+        with self._lock:
+            st.session_state[self._stats_key] = {
+                'hits': 0,
+                'misses': 0,
+                'errors': 0,
+                'last_reset': datetime.now()
+            }
         logger.info("Cache statistics reset")
 
 
@@ -301,7 +323,9 @@ def cache_with_monitoring(type: str = 'data', ttl: Optional[int] = 600):
         
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Reset tracking for this call
+            # Reset tracking for this call; a monitored function called from
+            # inside another one's miss must not clear the outer call's flag
+            outer_was_called = getattr(_cache_tracking, 'was_called', False)
             _cache_tracking.was_called = False
             
             monitor = CacheMonitor()
@@ -320,6 +344,8 @@ def cache_with_monitoring(type: str = 'data', ttl: Optional[int] = 600):
                 monitor.record_error()
                 logger.error(f"Cache error in {func.__name__}: {e}")
                 raise
+            finally:
+                _cache_tracking.was_called = outer_was_called
         
         return wrapper
     return decorator
@@ -347,6 +373,48 @@ def invalidate_cache_on_error(func: Callable) -> Callable:
     return wrapper
 
 
+# ============================================================================
+# Concurrent Loading
+# ============================================================================
+
+def load_concurrently(*calls: Tuple[Callable, tuple], max_workers: int = 4) -> List[Any]:
+    """
+    Run independent (cached) loaders in a small thread pool.
+    
+    Cold loads each wait on their own DB round trip, so overlapping them hides
+    most of the latency; warm loads return from the cache either way. Worker
+    threads get the script run context so cache monitoring (session_state)
+    keeps working.
+    
+    Usage:
+        home, away = load_concurrently(
+            (get_all_team_stats, (home_id, season_id)),
+            (get_all_team_stats, (away_id, season_id)),
+        )
+    
+    Args:
+        *calls: (function, args) tuples
+        max_workers: Thread pool size (keep within the DB pool size)
+    
+    Returns:
+        Results in the same order as calls; the first exception is re-raised
+    """
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+    
+    ctx = get_script_run_ctx()
+    
+    def attach_context():
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+    
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(calls)) or 1,
+        initializer=attach_context,
+    ) as executor:
+        futures = [executor.submit(func, *args) for func, args in calls]
+        return [future.result() for future in futures]
+
+
 # ============================================================================
 # Cache Warming
 # ============================================================================
@@ -129,6 +129,9 @@ def get_engine():
             max_overflow=settings.DB_MAX_OVERFLOW,
             pool_recycle=settings.DB_POOL_RECYCLE,
             pool_pre_ping=True,
+            # Hand out the most recently used connection so the hot one stays
+            # warm and surplus connections can idle out
+            pool_use_lifo=True,
             echo=settings.SQLALCHEMY_ECHO,
             connect_args={
                 "connect_timeout": 10,
@@ -139,14 +142,24 @@ def get_engine():
             }
         )
         logger.info("Database engine created successfully (cached)")
-        return engine
     except Exception as e:
         logger.error(f"Failed to create database engine: {e}")
         raise RuntimeError(f"Database connection failed: {e}")
 
+    # Open the first pooled connection now, so the first page query does not
+    # pay the TCP/TLS handshake; a failure here surfaces on first real use
+    try:
+        with engine.connect():
+            pass
+    except Exception as e:
+        logger.warning(f"Could not pre-open a database connection: {e}")
+
+    return engine
 
+
+@cache_resource_singleton()
 def get_session_maker():
-    """Create session maker bound to the cached engine."""
+    """Create session maker bound to the cached engine (cached)."""
     engine = get_engine()
     return sessionmaker(bind=engine, expire_on_commit=False)
 
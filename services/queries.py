@@ -4,14 +4,16 @@ from typing import List, Optional, Dict, Any
 from sqlalchemy import column, select, func, desc, and_, or_, text
 from sqlalchemy.orm import Session
 import pandas as pd
+import numpy as np
 import logging
 import streamlit as st
-from services.cache import cache_query_result, cache_resource_singleton
+from services.cache import cache_query_result, cache_resource_singleton, cache_shared_result
 
 logger = logging.getLogger(__name__)
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_active_season_from_config() -> int:
-    """Get active season ID from config/league_config.yaml."""
+    """Get active season ID from config/league_config.yaml (parsed once per hour, not per rerun)."""
     import yaml
     from pathlib import Path
     
@@ -47,6 +49,35 @@ def _safe_int(val: Any, default: int = 0) -> int:
         except Exception:
             return default
 
+def _model_to_dict(instance: Any, fill_none: bool = True) -> Dict[str, Any]:
+    """
+    Convert an ORM instance to a plain dict, reading each attribute once.
+    
+    Decimal values become float; None becomes 0 when fill_none is True.
+    """
+    from sqlalchemy import inspect
+    
+    row = {}
+    for col in inspect(instance.__class__).columns:
+        value = getattr(instance, col.key)
+        if value is None:
+            value = 0 if fill_none else None
+        elif isinstance(value, Decimal):
+            value = float(value)
+        row[col.key] = value
+    return row
+
+def _mapping_to_dict(mapping: Any, fill_none: bool = True) -> Dict[str, Any]:
+    """Like _model_to_dict, for a result row mapping (projected columns)."""
+    row = {}
+    for key, value in mapping.items():
+        if value is None:
+            value = 0 if fill_none else None
+        elif isinstance(value, Decimal):
+            value = float(value)
+        row[key] = value
+    return row
+
 @cache_query_result(ttl=1200)
 def get_upcoming_fixtures(
     season_id: Optional[int] = None,
@@ -127,8 +158,9 @@ def get_upcoming_fixtures(
             sql += " AND tournament_id = :tournament_id"
             params['tournament_id'] = _safe_int(tournament_id)
 
-        # Use string formatting for LIMIT instead of parameterization
-        sql += f" ORDER BY start_timestamp ASC LIMIT {limit}"
+        # Bind LIMIT too, so the SQL text is identical across calls (plan reuse)
+        sql += " ORDER BY start_timestamp ASC LIMIT :limit"
+        params['limit'] = limit
         
         result = db.execute(text(sql), params).fetchall()
         
@@ -161,7 +193,7 @@ def get_upcoming_fixtures(
     finally:
         db.close()
 
-@st.cache_data(ttl=1200, show_spinner=False)
+@cache_query_result(ttl=1200)
 def get_team_form(team_id: int, last_n_matches: int = 5) -> Dict[str, Any]:
     """
     Get team form statistics for the specified number of recent matches.
@@ -242,14 +274,39 @@ def get_team_form(team_id: int, last_n_matches: int = 5) -> Dict[str, Any]:
     finally:
         db.close()
 
-@cache_query_result(ttl=1200)
 def get_all_team_stats(
     team_id: int,
     season_id: Optional[int] = None
 ) -> Dict[str, Dict[str, Any]]:
     """
     Get all team statistics categories in a few database calls.
-    Optimized to reduce roundtrips.
+    
+    Finished seasons no longer change, so their rows are cached once per
+    process and shared by every session (treat the result as read-only).
+    The active season (or no season_id) keeps the per-call cache_data copy
+    with the usual TTL so pipeline refreshes show up.
+    """
+    if season_id and _safe_int(season_id) != get_active_season_from_config():
+        return _historical_team_stats(team_id, season_id)
+    return _live_team_stats(team_id, season_id)
+
+@cache_query_result(ttl=1200)
+def _live_team_stats(team_id: int, season_id: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """Active-season stats: copied per caller, refreshed every 20 minutes."""
+    return _read_all_team_stats(team_id, season_id)
+
+@cache_shared_result(ttl=86400)
+def _historical_team_stats(team_id: int, season_id: int) -> Dict[str, Dict[str, Any]]:
+    """Past-season stats: one shared copy for all sessions (immutable data, daily TTL as a safety net)."""
+    return _read_all_team_stats(team_id, season_id)
+
+def _read_all_team_stats(
+    team_id: int,
+    season_id: Optional[int] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Read all statistics categories for one team-season (uncached).
+    Optimized to reduce roundtrips: one joined query, per-table fallback.
     """
     from src.models.team_attack import TeamAttack
     from src.models.team_defense import TeamDefense
@@ -259,7 +316,6 @@ def get_all_team_stats(
     from src.models.team_btts_analysis import TeamBttsAnalysis
     from src.models.team_season_summary import TeamSeasonSummary
     from services.db import get_db
-    from sqlalchemy import inspect
 
     db = next(get_db())
     team_id = _safe_int(team_id)
@@ -317,15 +373,7 @@ def get_all_team_stats(
             for i, (stat_type, model) in enumerate(model_map.items()):
                 result = row[i]
                 if result:
-                    mapper = inspect(result.__class__)
-                    results[stat_type] = {
-                        column.key: (
-                            float(getattr(result, column.key)) 
-                            if isinstance(getattr(result, column.key), Decimal)
-                            else getattr(result, column.key)
-                        )
-                        for column in mapper.columns
-                    }
+                    results[stat_type] = _model_to_dict(result, fill_none=False)
                 else:
                     results[stat_type] = {}
         else:
@@ -333,15 +381,7 @@ def get_all_team_stats(
             for stat_type, model in model_map.items():
                 res = db.execute(select(model).where(model.team_id == team_id, model.season_id == season_id)).scalar_one_or_none()
                 if res:
-                    mapper = inspect(res.__class__)
-                    results[stat_type] = {
-                        column.key: (
-                            float(getattr(res, column.key)) 
-                            if isinstance(getattr(res, column.key), Decimal)
-                            else getattr(res, column.key)
-                        )
-                        for column in mapper.columns
-                    }
+                    results[stat_type] = _model_to_dict(res, fill_none=False)
                 else:
                     results[stat_type] = {}
         
@@ -353,7 +393,8 @@ def get_all_team_stats(
 def get_team_stats(
     stat_type: str,
     season_id: Optional[int] = None,
-    team_id: Optional[int] = None
+    team_id: Optional[int] = None,
+    columns: Optional[tuple] = None
 ) -> Dict[str, Any] | pd.DataFrame:
     
     from src.models.team_attack import TeamAttack
@@ -371,6 +412,9 @@ def get_team_stats(
         stat_type: One of 'attack', 'defense', 'possession', 'discipline', 'overview'
         season_id: Season to filter by (None for latest)
         team_id: Team identifier (None for ALL teams - returns DataFrame)
+        columns: Optional column names to fetch (SELECT list); None fetches
+            every column of the table. The ALL teams DataFrame always
+            includes team_id, team_name, season_id and matches_played.
     
     Returns:
         If team_id provided: Dictionary with statistics for that team
@@ -397,10 +441,20 @@ def get_team_stats(
         
         model = model_map[stat_type]
         
+        # Projection: only the requested columns go into the SELECT list
+        selected = None
+        if columns:
+            unknown = set(columns) - set(model.__table__.columns.keys())
+            if unknown:
+                raise ValueError(f"Unknown {stat_type} columns: {sorted(unknown)}")
+            names = columns if team_id is not None else STAT_KEY_COLUMNS + tuple(columns)
+            selected = [getattr(model, name) for name in dict.fromkeys(names)]
+        
         # Build base query
         if team_id is not None:
             # Single team query
-            query = select(model).where(model.team_id == team_id)
+            query = select(*selected) if selected else select(model)
+            query = query.where(model.team_id == team_id)
             
             if season_id:
                 query = query.where(model.season_id == season_id)
@@ -411,27 +465,21 @@ def get_team_stats(
                 ).scalar_subquery()
                 query = query.where(model.season_id == subquery)
             
+            if selected:
+                result = db.execute(query).one_or_none()
+                return _mapping_to_dict(result._mapping) if result else {}
+            
             result = db.execute(query).scalar_one_or_none()
             
             if not result:
                 return {}
             
             # Convert to dict
-            from sqlalchemy import inspect
-            mapper = inspect(result.__class__)
-            
-            return {
-                column.key: (
-                    float(getattr(result, column.key)) 
-                    if isinstance(getattr(result, column.key), Decimal) and getattr(result, column.key) is not None
-                    else (getattr(result, column.key) if getattr(result, column.key) is not None else 0)
-                )
-                for column in mapper.columns
-            }
+            return _model_to_dict(result)
         
         else:
             # ALL teams query - return DataFrame
-            query = select(model)
+            query = select(*selected) if selected else select(model)
             
             if season_id:
                 query = query.where(model.season_id == season_id)
@@ -440,27 +488,15 @@ def get_team_stats(
                 subquery = select(func.max(model.season_id)).scalar_subquery()
                 query = query.where(model.season_id == subquery)
             
-            results = db.execute(query).scalars().all()
+            if selected:
+                data = [_mapping_to_dict(row._mapping) for row in db.execute(query)]
+            else:
+                data = [_model_to_dict(result) for result in db.execute(query).scalars().all()]
             
-            if not results:
+            if not data:
                 return pd.DataFrame()
             
             # Convert to DataFrame
-            from sqlalchemy import inspect
-            
-            data = []
-            for result in results:
-                mapper = inspect(result.__class__)
-                row = {
-                    column.key: (
-                        float(getattr(result, column.key)) 
-                        if isinstance(getattr(result, column.key), Decimal) and getattr(result, column.key) is not None
-                        else (getattr(result, column.key) if getattr(result, column.key) is not None else 0)
-                    )
-                    for column in mapper.columns
-                }
-                data.append(row)
-            
             return pd.DataFrame(data)
     
     finally:
@@ -493,17 +529,7 @@ def get_league_averages(
             logger.warning(f"No league averages found for season_id: {season_id}")
             return {}
         
-        from sqlalchemy import inspect
-        mapper = inspect(result.__class__)
-        
-        return {
-            column.key: (
-                float(getattr(result, column.key)) 
-                if isinstance(getattr(result, column.key), Decimal) and getattr(result, column.key) is not None
-                else (getattr(result, column.key) if getattr(result, column.key) is not None else 0)
-            )
-            for column in mapper.columns
-        }
+        return _model_to_dict(result)
     
     except Exception as e:
         logger.error(f"Error fetching league averages for season {season_id}: {e}")
@@ -738,7 +764,7 @@ def get_match_predictions(match_ids: List[int]) -> pd.DataFrame:
     finally:
         db.close()
 
-@st.cache_data(ttl=1200, show_spinner=False)        
+@cache_query_result(ttl=3600)
 def get_league_standings(season_id: int) -> pd.DataFrame:
 
     season_id = _safe_int(season_id)
@@ -795,6 +821,46 @@ def get_league_standings(season_id: int) -> pd.DataFrame:
     finally:
         db.close()
 
+# Columns of mart_team_btts_analysis exposed by get_btts_analysis: summary
+# rates are None when missing, the goal-line breakdowns default to 0.0
+_BTTS_SUMMARY_FIELDS = [
+    f'{scope}_{metric}'
+    for scope in ('overall', 'home', 'away')
+    for metric in ('win_pct', 'btts_pct', 'clean_sheet_pct', 'avg_goals_per_match', 'avg_scored', 'avg_conceded')
+] + [f'{scope}_{metric}' for scope in ('home', 'away') for metric in ('avg_xg', 'avg_xga')]
+_BTTS_BREAKDOWN_FIELDS = [
+    f'{scope}_{kind}_over_{line}_pct'
+    for scope in ('home', 'away')
+    for kind in ('scored', 'conceded')
+    for line in ('05', '15', '25', '35')
+] + ['home_failed_to_score_pct', 'away_failed_to_score_pct']
+
+def btts_analysis_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shape a raw mart_team_btts_analysis row (column -> value) like get_btts_analysis.
+    
+    Lets callers that already hold the row, e.g. get_all_team_stats()['btts'],
+    skip a second query for the same table.
+    """
+    if not row:
+        return {}
+    
+    def number(key, default):
+        value = row.get(key)
+        return float(value) if value is not None else default
+    
+    analysis = {
+        'team_id': row.get('team_id'),
+        'team_name': row.get('team_name'),
+        'season_name': row.get('season_name'),
+        'matches_played': row.get('matches_played'),
+        'home_matches': row.get('home_matches_played'),
+        'away_matches': row.get('away_matches_played'),
+    }
+    analysis.update({key: number(key, None) for key in _BTTS_SUMMARY_FIELDS})
+    analysis.update({key: number(key, 0.0) for key in _BTTS_BREAKDOWN_FIELDS})
+    return analysis
+
 @cache_query_result(ttl=1200)
 def get_btts_analysis(team_id: int, season_id: Optional[int] = None) -> Dict[str, Any]:
     """
@@ -828,62 +894,7 @@ def get_btts_analysis(team_id: int, season_id: Optional[int] = None) -> Dict[str
         if not result:
             return {}
         
-        return {
-            'team_id': result.team_id,
-            'team_name': result.team_name,
-            'season_name': result.season_name,
-            'matches_played': result.matches_played,
-            # Overall stats
-            'overall_win_pct': float(getattr(result, 'overall_win_pct')) if getattr(result, 'overall_win_pct') is not None else None,
-            'overall_btts_pct': float(getattr(result, 'overall_btts_pct')) if getattr(result, 'overall_btts_pct') is not None else None,
-            'overall_clean_sheet_pct': float(getattr(result, 'overall_clean_sheet_pct')) if getattr(result, 'overall_clean_sheet_pct') is not None else None,
-            'overall_avg_goals_per_match': float(getattr(result, 'overall_avg_goals_per_match')) if getattr(result, 'overall_avg_goals_per_match') is not None else None,
-            'overall_avg_scored': float(getattr(result, 'overall_avg_scored')) if getattr(result, 'overall_avg_scored') is not None else None,
-            'overall_avg_conceded': float(getattr(result, 'overall_avg_conceded')) if getattr(result, 'overall_avg_conceded') is not None else None,
-            # Home stats
-            'home_matches': result.home_matches_played,
-            'home_win_pct': float(getattr(result, 'home_win_pct')) if getattr(result, 'home_win_pct') is not None else None,
-            'home_btts_pct': float(getattr(result, 'home_btts_pct')) if getattr(result, 'home_btts_pct') is not None else None,
-            'home_clean_sheet_pct': float(getattr(result, 'home_clean_sheet_pct')) if getattr(result, 'home_clean_sheet_pct') is not None else None,
-            'home_avg_goals_per_match': float(getattr(result, 'home_avg_goals_per_match')) if getattr(result, 'home_avg_goals_per_match') is not None else None,
-            'home_avg_scored': float(getattr(result, 'home_avg_scored')) if getattr(result, 'home_avg_scored') is not None else None,
-            'home_avg_conceded': float(getattr(result, 'home_avg_conceded')) if getattr(result, 'home_avg_conceded') is not None else None,
-            'home_avg_xg': float(getattr(result, 'home_avg_xg')) if getattr(result, 'home_avg_xg') is not None else None,
-            'home_avg_xga': float(getattr(result, 'home_avg_xga')) if getattr(result, 'home_avg_xga') is not None else None,
-            # Away stats
-            'away_matches': result.away_matches_played,
-            'away_win_pct': float(getattr(result, 'away_win_pct')) if getattr(result, 'away_win_pct') is not None else None,
-            'away_btts_pct': float(getattr(result, 'away_btts_pct')) if getattr(result, 'away_btts_pct') is not None else None,
-            'away_clean_sheet_pct': float(getattr(result, 'away_clean_sheet_pct')) if getattr(result, 'away_clean_sheet_pct') is not None else None,
-            'away_avg_goals_per_match': float(getattr(result, 'away_avg_goals_per_match')) if getattr(result, 'away_avg_goals_per_match') is not None else None,
-            'away_avg_scored': float(getattr(result, 'away_avg_scored')) if getattr(result, 'away_avg_scored') is not None else None,
-            'away_avg_conceded': float(getattr(result, 'away_avg_conceded')) if getattr(result, 'away_avg_conceded') is not None else None,
-            'away_avg_xg': float(getattr(result, 'away_avg_xg')) if getattr(result, 'away_avg_xg') is not None else None,
-            'away_avg_xga': float(getattr(result, 'away_avg_xga')) if getattr(result, 'away_avg_xga') is not None else None,
-            
-            # Scoring breakdowns
-            'home_scored_over_05_pct': float(getattr(result, 'home_scored_over_05_pct')) if getattr(result, 'home_scored_over_05_pct') is not None else 0.0,
-            'home_scored_over_15_pct': float(getattr(result, 'home_scored_over_15_pct')) if getattr(result, 'home_scored_over_15_pct') is not None else 0.0,
-            'home_scored_over_25_pct': float(getattr(result, 'home_scored_over_25_pct')) if getattr(result, 'home_scored_over_25_pct') is not None else 0.0,
-            'home_scored_over_35_pct': float(getattr(result, 'home_scored_over_35_pct')) if getattr(result, 'home_scored_over_35_pct') is not None else 0.0,
-            'home_failed_to_score_pct': float(getattr(result, 'home_failed_to_score_pct')) if getattr(result, 'home_failed_to_score_pct') is not None else 0.0,
-            
-            'away_scored_over_05_pct': float(getattr(result, 'away_scored_over_05_pct')) if getattr(result, 'away_scored_over_05_pct') is not None else 0.0,
-            'away_scored_over_15_pct': float(getattr(result, 'away_scored_over_15_pct')) if getattr(result, 'away_scored_over_15_pct') is not None else 0.0,
-            'away_scored_over_25_pct': float(getattr(result, 'away_scored_over_25_pct')) if getattr(result, 'away_scored_over_25_pct') is not None else 0.0,
-            'away_scored_over_35_pct': float(getattr(result, 'away_scored_over_35_pct')) if getattr(result, 'away_scored_over_35_pct') is not None else 0.0,
-            'away_failed_to_score_pct': float(getattr(result, 'away_failed_to_score_pct')) if getattr(result, 'away_failed_to_score_pct') is not None else 0.0,
-            
-            'home_conceded_over_05_pct': float(getattr(result, 'home_conceded_over_05_pct')) if getattr(result, 'home_conceded_over_05_pct') is not None else 0.0,
-            'home_conceded_over_15_pct': float(getattr(result, 'home_conceded_over_15_pct')) if getattr(result, 'home_conceded_over_15_pct') is not None else 0.0,
-            'home_conceded_over_25_pct': float(getattr(result, 'home_conceded_over_25_pct')) if getattr(result, 'home_conceded_over_25_pct') is not None else 0.0,
-            'home_conceded_over_35_pct': float(getattr(result, 'home_conceded_over_35_pct')) if getattr(result, 'home_conceded_over_35_pct') is not None else 0.0,
-            
-            'away_conceded_over_05_pct': float(getattr(result, 'away_conceded_over_05_pct')) if getattr(result, 'away_conceded_over_05_pct') is not None else 0.0,
-            'away_conceded_over_15_pct': float(getattr(result, 'away_conceded_over_15_pct')) if getattr(result, 'away_conceded_over_15_pct') is not None else 0.0,
-            'away_conceded_over_25_pct': float(getattr(result, 'away_conceded_over_25_pct')) if getattr(result, 'away_conceded_over_25_pct') is not None else 0.0,
-            'away_conceded_over_35_pct': float(getattr(result, 'away_conceded_over_35_pct')) if getattr(result, 'away_conceded_over_35_pct') is not None else 0.0,
-        }
+        return btts_analysis_from_row(_model_to_dict(result, fill_none=False))
     finally:
         db.close()
 
@@ -937,7 +948,7 @@ def get_btts_analysis(team_id: int, season_id: Optional[int] = None) -> Dict[str
 
 
 # Helper function to get all seasons
-@cache_query_result(ttl=1200)
+@cache_query_result(ttl=3600)
 def get_all_seasons() -> pd.DataFrame:
     """
     Get list of all available seasons.
@@ -1199,6 +1210,214 @@ def get_bulk_head_to_head(fixture_pairs: list) -> dict:
     finally:
         db.close()
 
+# League-wide stat tables (stat_type -> gold mart); whitelist for raw SQL
+STAT_TABLES = {
+    'attack': 'gold.mart_team_attack',
+    'defense': 'gold.mart_team_defense',
+    'possession': 'gold.mart_team_possession',
+    'discipline': 'gold.mart_team_discipline',
+}
+
+# Always selected so rows can be identified and per-game values put in context
+STAT_KEY_COLUMNS = ('team_id', 'team_name', 'season_id', 'matches_played')
+
+def _get_stat_table_columns(stat_type: str) -> List[str]:
+    """Column names of a league-wide stat table, taken from its ORM model."""
+    from src.models.team_attack import TeamAttack
+    from src.models.team_defense import TeamDefense
+    from src.models.team_possession import TeamPossession
+    from src.models.team_discipline import TeamDiscipline
+    
+    model_map = {
+        'attack': TeamAttack,
+        'defense': TeamDefense,
+        'possession': TeamPossession,
+        'discipline': TeamDiscipline
+    }
+    return [col.name for col in model_map[stat_type].__table__.columns]
+
+def _copy_to_arrow(conn, stmt) -> pd.DataFrame:
+    """
+    Stream a query result as CSV via COPY and parse it with pyarrow.
+    
+    Rows never become Python tuples: PostgreSQL writes CSV and pyarrow parses
+    it in C++ straight into Arrow arrays (NUMERIC arrives as double, not
+    Decimal). COPY cannot take bind parameters, so the statement is compiled
+    with literal values; only use it for ints and ORM-derived identifiers.
+    
+    PostgreSQL CSV writes NULL as an unquoted empty field and '' as "", so
+    only unquoted empty strings are read as null (e.g. the team_name of a
+    team missing from one side of a FULL JOIN).
+    """
+    import io
+    from pyarrow import csv as pa_csv
+    
+    query = str(stmt.compile(conn, compile_kwargs={'literal_binds': True}))
+    
+    buffer = io.BytesIO()
+    with conn.connection.dbapi_connection.cursor() as cur:
+        cur.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER true)", buffer)
+    buffer.seek(0)
+    
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True, quoted_strings_can_be_null=False)
+    return pa_csv.read_csv(buffer, convert_options=convert_options).to_pandas(types_mapper=pd.ArrowDtype)
+
+def _selected_stat_columns(stat_type: str, columns: Optional[tuple] = None) -> List[str]:
+    """Validated column list for a stat table: key columns + requested metrics (or all)."""
+    if stat_type not in STAT_TABLES:
+        raise ValueError(f"Invalid stat_type: {stat_type}")
+    
+    table_columns = _get_stat_table_columns(stat_type)
+    if not columns:
+        return table_columns
+    
+    unknown = set(columns) - set(table_columns)
+    if unknown:
+        raise ValueError(f"Unknown {stat_type} columns: {sorted(unknown)}")
+    return list(dict.fromkeys(STAT_KEY_COLUMNS + tuple(columns)))
+
+def _fetch_frame(conn, stmt) -> pd.DataFrame:
+    """Run a SELECT into an Arrow-backed DataFrame (COPY on psycopg2, read_sql otherwise)."""
+    if conn.dialect.driver == 'psycopg2':
+        return _copy_to_arrow(conn, stmt)
+    
+    # Other drivers: regular row fetch. coerce_float turns NUMERIC (Decimal)
+    # columns into floats; the pyarrow backend keeps columns Arrow-typed
+    # instead of boxing every cell
+    return pd.read_sql(stmt, conn, coerce_float=True, dtype_backend='pyarrow')
+
+def _fill_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Fill missing numeric values with 0 (the league tables treat 'no data' as 0)."""
+    numeric_cols = df.select_dtypes(include='number').columns
+    df[numeric_cols] = df[numeric_cols].fillna(0)
+    return df
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store float columns as float32 and int columns as int32 (when they fit).
+    
+    Per-game stats and counts need nothing wider, and halving the width keeps
+    the cached league frames small and quicker to scan, rank and average.
+    """
+    for col in df.select_dtypes(include='number').columns:
+        series = df[col]
+        if pd.api.types.is_float_dtype(series.dtype):
+            target = 'float32'
+        elif series.empty or (series.min() >= np.iinfo(np.int32).min and series.max() <= np.iinfo(np.int32).max):
+            target = 'int32'
+        else:
+            continue
+        if isinstance(series.dtype, pd.ArrowDtype):
+            target = f'{target}[pyarrow]'
+        df[col] = series.astype(target)
+    return df
+
+def _read_team_stats(conn, season_id: int, stat_type: str, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """Read one league-wide stat table on an open connection (see load_team_stats)."""
+    selected = _selected_stat_columns(stat_type, columns)
+    
+    # Identifiers come from the ORM models, never from user input
+    stmt = text(
+        f"SELECT {', '.join(selected)} FROM {STAT_TABLES[stat_type]} WHERE season_id = :season_id"
+    ).bindparams(season_id=_safe_int(season_id))
+    
+    return _downcast_numeric(_fill_numeric(_fetch_frame(conn, stmt)))
+
+def _read_joined_team_stats(conn, season_id: int, stat_columns: Dict[str, Optional[tuple]]) -> Dict[str, pd.DataFrame]:
+    """
+    Read several stat tables for a season in ONE query and split the result.
+    
+    The tables are FULL JOINed on (team_id, season_id); every other column is
+    aliased '<stat_type>__<column>' since tables share column names (e.g.
+    touches_in_box_per_game), then each stat type's slice is renamed back.
+    """
+    selected = {stat_type: _selected_stat_columns(stat_type, columns) for stat_type, columns in stat_columns.items()}
+    join_keys = ('team_id', 'season_id')
+    
+    select_list = list(join_keys)
+    sources = []
+    for i, (stat_type, cols) in enumerate(selected.items()):
+        select_list += [f"t{i}.{col} AS {stat_type}__{col}" for col in cols if col not in join_keys]
+        subquery = (
+            f"(SELECT {', '.join(cols)} FROM {STAT_TABLES[stat_type]} "
+            f"WHERE season_id = :season_id) t{i}"
+        )
+        sources.append(subquery if i == 0 else f"FULL JOIN {subquery} USING (team_id, season_id)")
+    
+    # Identifiers come from the ORM models, never from user input
+    stmt = text(
+        f"SELECT {', '.join(select_list)} FROM {' '.join(sources)}"
+    ).bindparams(season_id=_safe_int(season_id))
+    
+    joined = _fetch_frame(conn, stmt)
+    
+    frames = {}
+    for stat_type, cols in selected.items():
+        prefix = f"{stat_type}__"
+        frame = joined[list(join_keys) + [f"{prefix}{col}" for col in cols if col not in join_keys]]
+        frame = frame.rename(columns=lambda col: col[len(prefix):] if col.startswith(prefix) else col)
+        # Teams missing from this table only exist on the other side of the join
+        frame = frame[frame['team_name'].notna()].reset_index(drop=True)
+        frames[stat_type] = _downcast_numeric(_fill_numeric(frame[cols].copy()))
+    
+    return frames
+
+@cache_query_result(ttl=3600)
+def load_team_stats(
+    season_id: int,
+    stat_type: str,
+    columns: Optional[tuple] = None
+) -> pd.DataFrame:
+    """
+    Get one stat table for all teams in a season (cached per season/table).
+    
+    Args:
+        season_id: Season identifier
+        stat_type: One of 'attack', 'defense', 'possession', 'discipline'
+        columns: Optional metric columns to fetch (key columns are always
+            included); None fetches every column of the table
+    
+    Returns:
+        DataFrame with one row per team (pyarrow-backed float32/int32); numeric
+        missing values filled with 0
+    """
+    from services.db import get_engine
+    
+    with get_engine().connect() as conn:
+        return _read_team_stats(conn, _safe_int(season_id), stat_type, columns)
+
+@cache_shared_result(ttl=3600)
+def load_league_stats(
+    season_id: int,
+    stat_columns: Dict[str, Optional[tuple]]
+) -> Dict[str, pd.DataFrame]:
+    """
+    Get several league-wide stat tables for a season in one query.
+    
+    Args:
+        season_id: Season identifier
+        stat_columns: Mapping of stat_type -> column tuple (or None for all
+            columns), as accepted by load_team_stats
+    
+    Returns:
+        Dict mapping stat_type -> DataFrame. The frames are shared between
+        reruns and sessions (no per-call copy); .copy() before mutating.
+    
+    Example:
+        frames = load_league_stats(season_id, {'attack': None, 'defense': None})
+    """
+    from services.db import get_engine
+    
+    season_id = _safe_int(season_id)
+    
+    with get_engine().connect() as conn:
+        if len(stat_columns) == 1:
+            (stat_type, columns), = stat_columns.items()
+            return {stat_type: _read_team_stats(conn, season_id, stat_type, columns)}
+        
+        # One round trip and one parse for the whole batch
+        return _read_joined_team_stats(conn, season_id, stat_columns)
+
 @cache_query_result(ttl=1800)
 def get_bulk_league_stats(season_id: int) -> Dict[str, pd.DataFrame]:
     """
@@ -1207,46 +1426,76 @@ def get_bulk_league_stats(season_id: int) -> Dict[str, pd.DataFrame]:
     Returns:
         Dict mapping stat_type -> DataFrame
     """
-    from src.models.team_attack import TeamAttack
-    from src.models.team_defense import TeamDefense
-    from src.models.team_possession import TeamPossession
-    from src.models.team_discipline import TeamDiscipline
-    from services.db import get_db
-    from sqlalchemy import select
-    from decimal import Decimal
+    return load_league_stats(season_id, {stat_type: None for stat_type in STAT_TABLES})
+
+@cache_query_result(ttl=3600)
+def load_team_league_profile(
+    season_id: int,
+    stat_type: str,
+    team_id: int,
+    metrics: tuple
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Get league averages and a team's league percentiles computed in the database.
     
-    season_id = _safe_int(season_id)
-    db = next(get_db())
+    Window functions run over the whole season partition, but only the
+    selected team's row is returned. Percentiles use the same 'rank'
+    definition as services.transforms.calculate_league_stats_and_percentiles
+    (ties count half): 50 * (rank / n + cume_dist).
     
-    try:
-        results = {}
-        model_map = {
-            'attack': TeamAttack,
-            'defense': TeamDefense,
-            'possession': TeamPossession,
-            'discipline': TeamDiscipline
-        }
-        
-        from sqlalchemy import inspect
-        
-        for stat_type, model in model_map.items():
-            query = select(model).where(model.season_id == season_id)
-            rows = db.execute(query).scalars().all()
-            
-            data = []
-            for r in rows:
-                mapper = inspect(r.__class__)
-                row_dict = {
-                    column.key: (
-                        float(getattr(r, column.key)) 
-                        if isinstance(getattr(r, column.key), Decimal) and getattr(r, column.key) is not None
-                        else (getattr(r, column.key) if getattr(r, column.key) is not None else 0)
-                    )
-                    for column in mapper.columns
-                }
-                data.append(row_dict)
-            results[stat_type] = pd.DataFrame(data)
-            
-        return results
-    finally:
-        db.close()
+    Args:
+        season_id: Season identifier
+        stat_type: One of 'attack', 'defense', 'possession', 'discipline'
+        team_id: Team identifier
+        metrics: Metric columns of the stat table
+    
+    Returns:
+        {'avg': {metric: league_average}, 'pct': {metric: percentile or None}};
+        empty dicts if the team has no row for the season
+    """
+    from services.db import get_engine
+    
+    table_name = STAT_TABLES.get(stat_type)
+    if not table_name:
+        raise ValueError(f"Invalid stat_type: {stat_type}")
+    
+    unknown = set(metrics) - set(_get_stat_table_columns(stat_type))
+    if unknown:
+        raise ValueError(f"Unknown {stat_type} columns: {sorted(unknown)}")
+    
+    # Missing values count as 0, like the fillna(0) in _read_team_stats
+    expressions = []
+    for metric in metrics:
+        value = f"COALESCE({metric}, 0)"
+        expressions.append(f"avg({value}) OVER () AS avg__{metric}")
+        expressions.append(
+            f"CASE WHEN {metric} IS NULL THEN NULL ELSE "
+            f"50.0 * (rank() OVER (ORDER BY {value})::float8 / count(*) OVER () "
+            f"+ cume_dist() OVER (ORDER BY {value})) END AS pct__{metric}"
+        )
+    
+    # Identifiers come from the ORM models, never from user input
+    sql = text(f"""
+        WITH ranked AS (
+            SELECT team_id, {', '.join(expressions)}
+            FROM {table_name}
+            WHERE season_id = :season_id
+        )
+        SELECT * FROM ranked WHERE team_id = :team_id
+    """)
+    
+    with get_engine().connect() as conn:
+        row = conn.execute(
+            sql, {'season_id': _safe_int(season_id), 'team_id': _safe_int(team_id)}
+        ).mappings().first()
+    
+    if row is None:
+        return {'avg': {}, 'pct': {}}
+    
+    def as_float(value):
+        return float(value) if value is not None else None
+    
+    return {
+        'avg': {metric: as_float(row[f"avg__{metric}"]) for metric in metrics},
+        'pct': {metric: as_float(row[f"pct__{metric}"]) for metric in metrics},
+    }
@@ -14,10 +14,13 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import logging
-from scipy.stats import percentileofscore
+import warnings
 
 logger = logging.getLogger(__name__)
 
+# Points per result (built once, shared by the form helpers below)
+POINTS_MAP = {'W': 3, 'D': 1, 'L': 0}
+
 
 # ============================================================================
 # Rolling Averages and Windows
@@ -259,7 +262,7 @@ def calculate_form_score(
     
     # Default weights (same as points)
     if weights is None:
-        weights = {'W': 3, 'D': 1, 'L': 0}
+        weights = POINTS_MAP
     
     # Exponential decay weights (most recent = 1.0, oldest = 0.5)
     n = len(results)
@@ -559,6 +562,32 @@ def calculate_percentile_rank(
     return rank.round(2)
 
 
+def calculate_standings_position(standings_df: pd.DataFrame) -> pd.Series:
+    """
+    Calculate league table position without reordering the DataFrame.
+    
+    Teams are ranked by points, then goal difference, then goals scored.
+    Teams level on all three share the same (best) position.
+    
+    Args:
+        standings_df: DataFrame with total_points, goal_difference and goals_for
+    
+    Returns:
+        Series with 1-based positions aligned to standings_df index
+    
+    Example:
+        standings_df['position'] = calculate_standings_position(standings_df)
+    """
+    # Lexicographic key: points dominate goal difference, which dominates goals scored
+    key = (
+        standings_df['total_points'].astype('int64') * 1_000_000
+        + standings_df['goal_difference'].astype('int64') * 1_000
+        + standings_df['goals_for'].astype('int64')
+    )
+    
+    return (-key).rank(method='min').astype(int)
+
+
 # ============================================================================
 # Composite Metrics
 # ============================================================================
@@ -651,8 +680,7 @@ def calculate_points(results: List[str]) -> int:
     Returns:
         Total points (W=3, D=1, L=0)
     """
-    points_map = {'W': 3, 'D': 1, 'L': 0}
-    return sum(points_map.get(r, 0) for r in results)
+    return sum(POINTS_MAP.get(r, 0) for r in results)
 
 
 def calculate_goal_difference(
@@ -675,10 +703,73 @@ def calculate_goal_difference(
 # League Statistics and Percentiles
 # ============================================================================
 
+def metric_matrix(all_teams_df: pd.DataFrame, metrics: List[str]) -> np.ndarray:
+    """
+    Stack metric columns into one contiguous float32 matrix M[team, metric].
+    
+    Args:
+        all_teams_df: DataFrame with ALL teams' statistics
+        metrics: Metric column names (all must exist in the DataFrame)
+    
+    Returns:
+        C-contiguous float32 array of shape (n_teams, n_metrics); missing values are NaN
+    """
+    matrix = all_teams_df[list(metrics)].to_numpy(dtype=np.float32, na_value=np.nan)
+    return np.ascontiguousarray(matrix)
+
+# Identifier/bookkeeping columns that are never ranked or averaged
+LEAGUE_EXCLUDE_COLUMNS = [
+    'team_id', 'season_id', 'tournament_id', 'team_name', 
+    'matches_played', 'updated_at', 'created_at'
+]
+
+def _league_metric_columns(all_teams_df: pd.DataFrame) -> List[str]:
+    """Numeric columns of a league frame minus identifiers/bookkeeping."""
+    return [
+        col for col in all_teams_df.select_dtypes(include=['number']).columns
+        if col not in LEAGUE_EXCLUDE_COLUMNS
+    ]
+
+def calculate_league_percentiles(all_teams_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rank every team on every metric in one call.
+    
+    rank(pct=True, method='average') * 100 equals percentileofscore(kind='rank')
+    for a value taken from the column itself, so a row of this matrix matches
+    calculate_league_stats_and_percentiles for that team.
+    
+    Args:
+        all_teams_df: DataFrame with ALL teams' statistics (needs team_id)
+    
+    Returns:
+        DataFrame of percentiles (0-100) indexed by team_id, one column per metric
+    """
+    metric_cols = _league_metric_columns(all_teams_df)
+    ranks = all_teams_df[metric_cols].astype('float64').rank(pct=True, method='average') * 100
+    ranks.index = all_teams_df['team_id'].to_numpy()
+    return ranks
+
+def calculate_league_means(all_teams_df: pd.DataFrame) -> Dict[str, float]:
+    """
+    League average of every metric column (NaN-aware), in one matrix pass.
+    
+    Args:
+        all_teams_df: DataFrame with ALL teams' statistics
+    
+    Returns:
+        Dictionary of metric -> mean (NaN for all-missing columns)
+    """
+    metric_cols = _league_metric_columns(all_teams_df)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+        column_means = np.nanmean(metric_matrix(all_teams_df, metric_cols), axis=0)
+    return dict(zip(metric_cols, column_means.tolist()))
+
 def calculate_league_stats_and_percentiles(
     all_teams_df: pd.DataFrame,
     team_stats: Dict[str, Any],
-    league_avg: Optional[Dict[str, Any]] = None
+    league_avg: Optional[Dict[str, Any]] = None,
+    league_percentiles: Optional[pd.DataFrame] = None
 ) -> Tuple[Dict[str, float], Dict[str, float]]:
     """
     Calculate league averages and team percentiles from ALL teams data.
@@ -686,7 +777,12 @@ def calculate_league_stats_and_percentiles(
     Args:
         all_teams_df: DataFrame with ALL teams' statistics
         team_stats: Dictionary with selected team's statistics
-        league_avg: Optional pre-calculated league averages (if None, calculated from df)
+        league_avg: Optional pre-calculated league averages (if None, calculated from df);
+            e.g. calculate_league_means, so no metric columns are re-averaged
+        league_percentiles: Optional matrix from calculate_league_percentiles;
+            used when the team (team_stats['team_id']) is one of its rows
+    
+    With both precomputed, the league frame is never converted to a matrix.
     
     Returns:
         Tuple of (league_averages_dict, percentiles_dict)
@@ -694,41 +790,54 @@ def calculate_league_stats_and_percentiles(
     if all_teams_df.empty or not team_stats:
         return {}, {}
     
-    exclude_cols = [
-        'team_id', 'season_id', 'tournament_id', 'team_name', 
-        'matches_played', 'updated_at', 'created_at'
-    ]
-    
-    # Get numeric columns from the DataFrame
-    numeric_cols = all_teams_df.select_dtypes(include=['number']).columns
+    metric_cols = _league_metric_columns(all_teams_df)
+    league_avg = league_avg or {}
+    matrix = None
     
-    # Filter league_avg to only include columns present in this DataFrame
-    filtered_league_avg = {}
-    if league_avg:
-        for col in numeric_cols:
-            if col not in exclude_cols and col in league_avg:
-                filtered_league_avg[col] = league_avg[col]
+    # Pre-calculated averages win; the rest come from column means of the matrix
+    if all(col in league_avg for col in metric_cols):
+        filtered_league_avg = {col: league_avg[col] for col in metric_cols}
+    else:
+        matrix = metric_matrix(all_teams_df, metric_cols)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+            column_means = np.nanmean(matrix, axis=0)
+        filtered_league_avg = {
+            col: league_avg[col] if col in league_avg else float(column_means[j])
+            for j, col in enumerate(metric_cols)
+        }
+    
+    # Precomputed league ranks: just slice the team's row
+    team_id = team_stats.get('team_id')
+    if league_percentiles is not None and team_id in league_percentiles.index:
+        # One row gather to plain floats; no per-metric Series indexing
+        team_ranks = league_percentiles.loc[team_id, metric_cols].to_numpy(dtype=float).tolist()
+        percentiles = {
+            col: (None if team_stats.get(col) is None or np.isnan(rank) else rank)
+            for col, rank in zip(metric_cols, team_ranks) if col in team_stats
+        }
+        return filtered_league_avg, percentiles
+    
+    # Percentiles for the team in one broadcast over the matrix.
+    # Same 'rank' definition as scipy.stats.percentileofscore: ties count half.
+    if matrix is None:
+        matrix = metric_matrix(all_teams_df, metric_cols)
+    team_row = np.array(
+        [team_stats.get(col) if col in team_stats else None for col in metric_cols],
+        dtype=np.float32
+    )
+    below = (matrix < team_row).sum(axis=0)
+    at_or_below = (matrix <= team_row).sum(axis=0)
+    counts = (~np.isnan(matrix)).sum(axis=0)
     
-    # If no pre-calculated averages or missing columns, calculate from DataFrame
-    for col in numeric_cols:
-        if col not in exclude_cols and col not in filtered_league_avg:
-            filtered_league_avg[col] = float(all_teams_df[col].mean())
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ranks = (below + at_or_below + (below < at_or_below)) * (50.0 / counts)
     
-    # Calculate percentiles for team
     percentiles = {}
-    for col in numeric_cols:
-        if col not in exclude_cols and col in team_stats:
-            team_value = team_stats.get(col)
-            if team_value is not None and pd.notna(team_value):
-                col_values = all_teams_df[col].dropna()
-                if len(col_values) > 0:
-                    from scipy.stats import percentileofscore
-                    percentile = percentileofscore(col_values, float(team_value), kind='rank')
-                    percentiles[col] = float(percentile)
-                else:
-                    percentiles[col] = None
-            else:
-                percentiles[col] = None
+    for col, rank, team_value, count in zip(metric_cols, ranks, team_row, counts):
+        if col not in team_stats:
+            continue
+        percentiles[col] = None if np.isnan(team_value) or count == 0 else float(rank)
     
     return filtered_league_avg, percentiles
 
@@ -742,60 +851,71 @@ def calculate_radar_scales(
     """
     scales = {}
     
+    present = []
     for metric in metrics:
         if metric not in all_teams_df.columns:
             logger.warning(f"Metric '{metric}' not found in DataFrame")
             scales[metric] = (0, 1)
-            continue
-        
-        values = all_teams_df[metric].dropna()
-        
-        if len(values) == 0:
-            scales[metric] = (0, 1)
-            continue
-        
-        min_val = float(values.min())
-        max_val = float(values.max())
-        
-        range_val = max_val - min_val
-        if range_val == 0:
-            min_val = min_val * 0.9 if min_val > 0 else -0.5
-            max_val = max_val * 1.1 if max_val > 0 else 0.5
         else:
-            padding = range_val * padding_pct
-            min_val = max(0, min_val - padding)
-            max_val = max_val + padding
+            present.append(metric)
+    
+    if present:
+        matrix = metric_matrix(all_teams_df, present)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+            mins = np.nanmin(matrix, axis=0).astype(np.float64)
+            maxs = np.nanmax(matrix, axis=0).astype(np.float64)
+        
+        # Flat metrics get a fixed band around the value; others are padded
+        range_vals = maxs - mins
+        flat = range_vals == 0
+        low = np.where(
+            flat,
+            np.where(mins > 0, mins * 0.9, -0.5),
+            np.maximum(0, mins - range_vals * padding_pct)
+        ).round(2)
+        high = np.where(
+            flat,
+            np.where(maxs > 0, maxs * 1.1, 0.5),
+            maxs + range_vals * padding_pct
+        ).round(2)
         
-        scales[metric] = (round(min_val, 2), round(max_val, 2))
+        for metric, lo, hi in zip(present, low.tolist(), high.tolist()):
+            # Columns without any values fall back to a unit scale
+            scales[metric] = (0, 1) if np.isnan(lo) else (lo, hi)
     
-    return scales
+    return {metric: scales[metric] for metric in metrics}
 
 
 def normalize_for_radar(
-    values: List[float],
+    values,
     scales: Dict[str, Tuple[float, float]],
     metrics: List[str]
 ) -> List[float]:
     """
     Normalize values to 0-1 scale for radar chart.
+    
+    Args:
+        values: Metric values (list or ndarray) aligned with metrics
+        scales: Dictionary of metric -> (min, max) from calculate_radar_scales
+        metrics: Metric names
+    
+    Returns:
+        List of normalized values; 0.5 for metrics without a usable scale
     """
-    normalized = []
+    values = np.asarray(values, dtype=np.float64)
+    bounds = np.array([scales.get(metric, (np.nan, np.nan)) for metric in metrics], dtype=np.float64)
+    if len(bounds) == 0:
+        return []
     
-    for value, metric in zip(values, metrics):
-        if metric not in scales:
-            normalized.append(0.5)
-            continue
-        
-        min_val, max_val = scales[metric]
-        
-        if max_val - min_val == 0:
-            normalized.append(0.5)
-        else:
-            norm_val = (value - min_val) / (max_val - min_val)
-            norm_val = max(0, min(1, norm_val))
-            normalized.append(round(norm_val, 3))
+    lo, hi = bounds[:, 0], bounds[:, 1]
+    span = hi - lo
+    valid = np.isfinite(span) & (span != 0)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = np.clip((values - lo) / span, 0, 1)
     
-    return normalized
+    return np.where(valid, normalized.round(3), 0.5).tolist()
 
 
 def get_all_teams_stats(
@@ -812,27 +932,6 @@ def get_all_teams_stats(
     Returns:
         DataFrame with all teams statistics
     """
-    from services.db import get_engine
-    
-    table_map = {
-        'attack': 'mart_team_attack',
-        'defense': 'mart_team_defense',
-        'possession': 'mart_team_possession',
-        'discipline': 'mart_team_discipline'
-    }
-    
-    table_name = table_map.get(stat_type)
-    if not table_name:
-        raise ValueError(f"Invalid stat_type: {stat_type}")
-    
-    query = f"""
-        SELECT * 
-        FROM gold.{table_name}
-        WHERE season_id = {season_id}
-    """
-    
-    engine = get_engine()
-    with engine.connect() as conn:
-        df = pd.read_sql(query, conn)
+    from services.queries import load_team_stats
     
-    return df
+    return load_team_stats(season_id, stat_type)
@@ -5,6 +5,7 @@ from services.cache import (
     CacheMonitor,
     cache_query_result,
     cache_resource_singleton,
+    cache_shared_result,
     generate_cache_key,
 )
 
@@ -90,4 +91,58 @@ class TestCachePerformance:
         time2 = time.time() - start2
         
         assert result1 == result2
-        assert time2 < time1 / 2  # Cached call should be at least 2x faster
\ No newline at end of file
+        assert time2 < time1 / 2  # Cached call should be at least 2x faster
+    
+    def test_shared_cache_returns_same_object(self):
+        """Test that shared results are returned without a per-call copy."""
+        
+        @cache_shared_result(ttl=60)
+        def load_frame():
+            return {'rows': [1, 2, 3]}
+        
+        assert load_frame() is load_frame()
+
+
+@pytest.mark.unit
+class TestCacheMonitoringDecorator:
+    """Test hit/miss accounting of the monitored cache decorators."""
+    
+    def test_nested_miss_counts_outer_call_as_miss(self):
+        """A monitored call inside another's miss must not turn it into a hit."""
+        
+        @cache_query_result(ttl=60)
+        def inner_nested(x):
+            return x + 1
+        
+        @cache_shared_result(ttl=60)
+        def outer_nested(x):
+            return inner_nested(x) * 2
+        
+        monitor = CacheMonitor()
+        monitor.reset_stats()
+        
+        assert inner_nested(1) == 2  # inner miss, warms the inner cache
+        assert outer_nested(1) == 4  # outer miss around an inner hit
+        stats = monitor.get_stats()
+        assert stats['misses'] == 2
+        assert stats['hits'] == 1
+        
+        assert outer_nested(1) == 4  # outer hit, inner not called
+        stats = monitor.get_stats()
+        assert stats['misses'] == 2
+        assert stats['hits'] == 2
+    
+    def test_concurrent_records_are_not_lost(self):
+        """Counters stay exact when load_concurrently workers record at once."""
+        from services.cache import load_concurrently
+        
+        monitor = CacheMonitor()
+        monitor.reset_stats()
+        
+        def record_many():
+            for _ in range(2000):
+                CacheMonitor().record_hit()
+        
+        load_concurrently(*[(record_many, ()) for _ in range(4)])
+        
+        assert monitor.get_stats()['hits'] == 8000
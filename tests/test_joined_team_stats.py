@@ -0,0 +1,71 @@
+"""
+Unit tests for the joined league stat read (COPY -> pyarrow path) in services.queries.
+
+The psycopg2 cursor is faked: it writes the CSV PostgreSQL would send for
+the FULL JOIN, so no database is needed.
+"""
+
+import types
+
+import pytest
+from sqlalchemy.dialects.postgresql import psycopg2 as pg_psycopg2
+
+from services.queries import _read_joined_team_stats
+
+# COPY ... (FORMAT csv, HEADER true) output: NULL is an unquoted empty field.
+# Team 20 only has an attack row, team 30 only a defense row.
+JOINED_CSV = (
+    "team_id,season_id,attack__team_name,attack__matches_played,attack__goals_per_game,"
+    "defense__team_name,defense__matches_played,defense__goals_conceded_per_game\n"
+    "10,1,Alpha,3,2.0,Alpha,3,1.0\n"
+    "20,1,Beta,3,1.0,,,\n"
+    "30,1,,,,Gamma,3,3.0\n"
+)
+
+
+class _FakeCursor:
+    def __init__(self, sql_log):
+        self.sql_log = sql_log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def copy_expert(self, sql, buffer):
+        self.sql_log.append(sql)
+        buffer.write(JOINED_CSV.encode())
+
+
+def _fake_conn(sql_log):
+    dbapi_connection = types.SimpleNamespace(cursor=lambda: _FakeCursor(sql_log))
+    return types.SimpleNamespace(
+        dialect=pg_psycopg2.dialect(),
+        connection=types.SimpleNamespace(dbapi_connection=dbapi_connection),
+    )
+
+
+@pytest.mark.unit
+class TestReadJoinedTeamStats:
+    """Teams present in only one of the joined tables."""
+
+    def test_team_missing_from_one_table_is_dropped_not_zero_filled(self):
+        sql_log = []
+        frames = _read_joined_team_stats(
+            _fake_conn(sql_log),
+            1,
+            {'attack': ('goals_per_game',), 'defense': ('goals_conceded_per_game',)},
+        )
+
+        assert sql_log and sql_log[0].startswith("COPY (")
+
+        attack, defense = frames['attack'], frames['defense']
+        assert attack['team_id'].tolist() == [10, 20]
+        assert attack['team_name'].tolist() == ['Alpha', 'Beta']
+        assert defense['team_id'].tolist() == [10, 30]
+        assert defense['team_name'].tolist() == ['Alpha', 'Gamma']
+
+        # No zero-filled phantom rows dragging the league means down
+        assert attack['goals_per_game'].mean() == pytest.approx(1.5)
+        assert defense['goals_conceded_per_game'].mean() == pytest.approx(2.0)
@@ -0,0 +1,52 @@
+"""
+Smoke tests for pages/3_Teams.py rendered with streamlit.testing AppTest.
+
+Database reads are patched out, so the page runs without Postgres.
+"""
+
+import sys
+import types
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+PAGE = str(Path(__file__).resolve().parents[1] / "pages" / "3_Teams.py")
+
+
+@pytest.fixture
+def teams_app():
+    """AppTest for the Teams page with every query it makes on load patched out."""
+    seasons = pd.DataFrame({'season_id': [1], 'season_name': ['2024/25']})
+    standings = pd.DataFrame({
+        'team_id': [10, 20],
+        'team_name': ['Alpha', 'Beta'],
+        'matches_played': [3, 3],
+        'total_points': [7, 3],
+        'points_per_game': [2.33, 1.0],
+        'goal_difference': [4, -4],
+        'goals_for': [6, 2],
+    })
+
+    with mock.patch.dict(sys.modules, {'mplsoccer': types.ModuleType('mplsoccer')}), \
+            mock.patch('services.queries.get_all_seasons', return_value=seasons), \
+            mock.patch('services.queries.get_league_standings', side_effect=lambda _: standings.copy()), \
+            mock.patch('services.queries.get_league_averages', return_value={}), \
+            mock.patch('services.queries.load_league_stats', return_value={}), \
+            mock.patch('services.queries.get_all_team_stats', return_value={}):
+        yield AppTest.from_file(PAGE, default_timeout=30)
+
+
+@pytest.mark.parametrize("tab", [None, "Attack", "Discipline"])
+def test_page_renders_outside_form_tab(teams_app, tab):
+    """The footer reads the form window even when the Form tab is closed."""
+    if tab is not None:
+        teams_app.query_params["teams_active_tab"] = tab
+
+    teams_app.run()
+
+    assert not teams_app.exception
+    footer = teams_app.markdown[-1].value if teams_app.markdown else ""
+    assert any("Form window: Last 5 matches" in m.value for m in teams_app.markdown), footer
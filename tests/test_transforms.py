@@ -16,6 +16,12 @@ from services.transforms import (
     calculate_sos_rating,
     normalize_metrics,
     calculate_percentile_rank,
+    calculate_standings_position,
+    normalize_for_radar,
+    metric_matrix,
+    calculate_league_stats_and_percentiles,
+    calculate_league_percentiles,
+    calculate_league_means,
     calculate_composite_score,
     add_match_result,
     calculate_points,
@@ -187,6 +193,78 @@ class TestNormalization:
         assert 'goals_normalized' in result.columns
         # Mean should be around 50
         assert 40 < result['goals_normalized'].mean() < 60
+
+    def test_calculate_standings_position(self):
+        """Test standings position uses points, goal difference, goals for."""
+        df = pd.DataFrame({
+            'total_points': [10, 12, 10, 10],
+            'goal_difference': [3, -2, 3, 5],
+            'goals_for': [8, 4, 8, 6],
+        })
+        positions = calculate_standings_position(df)
+        
+        assert positions.tolist() == [3, 1, 3, 2]
+        assert positions.index.equals(df.index)
+
+    def test_normalize_for_radar(self):
+        """Test radar normalization clips to 0-1 and handles missing scales."""
+        scales = {'goals': (0.0, 10.0), 'shots': (5.0, 5.0)}
+        result = normalize_for_radar(
+            np.array([2.5, 7.0, 12.0]), scales, ['goals', 'shots', 'xg']
+        )
+        
+        assert result == [0.25, 0.5, 0.5]
+        assert normalize_for_radar([15.0], scales, ['goals']) == [1.0]
+    
+    def test_metric_matrix(self):
+        """Test metric columns are stacked into a contiguous float32 matrix."""
+        df = pd.DataFrame({'team_id': [1, 2], 'goals': [1.5, None], 'shots': [10, 12]})
+        matrix = metric_matrix(df, ['goals', 'shots'])
+        
+        assert matrix.dtype == np.float32
+        assert matrix.flags['C_CONTIGUOUS']
+        assert matrix.shape == (2, 2)
+        assert np.isnan(matrix[1, 0])
+    
+    def test_calculate_league_stats_and_percentiles(self):
+        """Test league averages and rank percentiles from the metric matrix."""
+        df = pd.DataFrame({'team_id': [1, 2, 3], 'xg_per_game': [1.1, 2.2, 3.3]})
+        league_avg, percentiles = calculate_league_stats_and_percentiles(df, {'xg_per_game': 2.2})
+        
+        assert league_avg['xg_per_game'] == pytest.approx(2.2)
+        assert percentiles['xg_per_game'] == pytest.approx(66.67, abs=0.01)
+        assert 'team_id' not in percentiles
+    
+    def test_calculate_league_percentiles_matches_team_percentiles(self):
+        """Test the precomputed rank matrix agrees with the per-team calculation."""
+        df = pd.DataFrame({
+            'team_id': [10, 20, 30, 40],
+            'goals': [1.0, 2.0, 2.0, 3.0],
+            'shots': [9.5, 12.0, 8.0, 15.5],
+        })
+        matrix = calculate_league_percentiles(df)
+        team_stats = df.iloc[1].to_dict()
+        
+        _, expected = calculate_league_stats_and_percentiles(df, team_stats)
+        _, from_matrix = calculate_league_stats_and_percentiles(df, team_stats, league_percentiles=matrix)
+        
+        assert list(matrix.index) == [10, 20, 30, 40]
+        assert from_matrix == pytest.approx(expected)
+        assert from_matrix['goals'] == pytest.approx(62.5)
+    
+    def test_calculate_league_means_as_precomputed_averages(self):
+        """Test cached league means reproduce the averages computed from the frame."""
+        df = pd.DataFrame({
+            'team_id': [10, 20, 30],
+            'goals': [1.0, None, 3.0],
+            'shots': [9.0, 12.0, 15.0],
+        })
+        means = calculate_league_means(df)
+        expected, _ = calculate_league_stats_and_percentiles(df, {'goals': 1.0})
+        from_means, _ = calculate_league_stats_and_percentiles(df, {'goals': 1.0}, league_avg=means)
+        
+        assert means == pytest.approx({'goals': 2.0, 'shots': 12.0})
+        assert from_means == pytest.approx(expected)
     
         def test_calculate_percentile_rank(self):
             """Test percentile rank calculation."""